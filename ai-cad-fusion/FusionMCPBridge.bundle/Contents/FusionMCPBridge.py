@@ -6,15 +6,25 @@ Delegates all actions to the split handler registry
 
 import adsk.core
 import adsk.fusion
+import hmac
 import json
+import logging
+import logging.handlers
+import os
+import queue
+import socket
+import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse
-import os
-import sys
 from importlib import import_module, invalidate_caches
 
+try:
+    import orjson
+except ImportError:  # Not shipped with Fusion's Python; stdlib fallback below
+    orjson = None
+
 # Dev mode: load from custom path if FUSIONMCP_DEV_PATH is set
 _dev_path = os.environ.get('FUSIONMCP_DEV_PATH')
 if _dev_path and os.path.isdir(_dev_path):
@@ -28,7 +38,32 @@ else:
 if _here and _here not in sys.path:
     sys.path.insert(0, _here)  # Insert at front to take priority
 
-# Config values are fetched dynamically at runtime to support /dev/reload of config.py
+# Config values are fetched dynamically at runtime to support /dev/reload of config.py.
+# The module references are cached and dropped on reload so the hot path avoids import_module.
+_CFG_MOD = None
+_ERROR_CLASSES = None
+
+
+def _get_cfg():
+    """Return the cached config module, importing it on first use after a reload."""
+    global _CFG_MOD
+    if _CFG_MOD is None:
+        _CFG_MOD = import_module('config')
+    return _CFG_MOD
+
+
+def _get_error_classes():
+    """Return (ValidationError, FusionAPIError, ActionNotSupportedError) for the current reload generation."""
+    global _ERROR_CLASSES
+    if _ERROR_CLASSES is None:
+        errors = import_module('core.errors')
+        _ERROR_CLASSES = (
+            getattr(errors, 'ValidationError', Exception),
+            getattr(errors, 'FusionAPIError', Exception),
+            getattr(errors, 'ActionNotSupportedError', Exception),
+        )
+    return _ERROR_CLASSES
+
 
 # Dev reload enablement helper: environment variable or config.DEV_RELOAD_ENABLED
 # We evaluate this at request time to avoid needing a full restart after toggling.
@@ -37,7 +72,7 @@ def _is_dev_reload_enabled() -> bool:
     try:
         if os.environ.get("BRIDGE_DEV_RELOAD"):
             return True
-        cfg = import_module('config')
+        cfg = _get_cfg()
         # Support both DEV_RELOAD_ENABLED and BRIDGE_DEV_RELOAD (int/bool)
         cfg_flag = getattr(cfg, 'DEV_RELOAD_ENABLED', None)
         if cfg_flag is not None:
@@ -56,8 +91,7 @@ def _is_dev_reload_enabled() -> bool:
 def _cfg(name: str, default=None):
     """Get a config value dynamically so /dev/reload can update it."""
     try:
-        cfg = import_module('config')
-        return getattr(cfg, name, default)
+        return getattr(_get_cfg(), name, default)
     except Exception:
         return default
 
@@ -83,12 +117,97 @@ def _cfg_version() -> str:
 def _cfg_auth_token():
     return _cfg('BRIDGE_AUTH_TOKEN', None)
 
+
+def _auth_token_bytes():
+    """BRIDGE_AUTH_TOKEN as bytes for constant-time comparison, or None when auth is off."""
+    token = _cfg_auth_token()
+    return None if token is None else str(token).encode("utf-8")
+
+
+def _cfg_http_threads() -> int:
+    try:
+        return max(1, int(_cfg('BRIDGE_HTTP_THREADS', 8)))
+    except Exception:
+        return 8
+
+
+def _cfg_keepalive_timeout() -> float:
+    # Always positive: without a timeout an idle keep-alive client pins a worker forever
+    try:
+        timeout = float(_cfg('BRIDGE_KEEPALIVE_TIMEOUT', 10))
+        return timeout if timeout > 0 else 10.0
+    except Exception:
+        return 10.0
+
+
+# Responses up to this size are sent with their headers in a single write;
+# larger stdlib-encoded bodies are written out in slices of this size
+_COALESCE_LIMIT = 64 * 1024
+
+
+def _json_bytes(data) -> bytes:
+    """Encode a small value to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode("ascii")
+
+
+def _json_loads(payload: bytes):
+    """Parse a request body from raw bytes."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _cfg_log_level() -> int:
+    level = _cfg('BRIDGE_LOG_LEVEL', 'INFO')
+    if not isinstance(level, int):
+        level = logging.getLevelName(str(level).upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+# Logging: request threads only enqueue records; a listener thread does the console I/O
+logger = logging.getLogger('FusionMCPBridge')
+logger.propagate = False
+_log_listener = None
+
+
+def _start_logging():
+    """Attach a queue-backed handler to the bridge logger and start its listener thread."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("[BRIDGE] %(message)s"))
+    for h in list(logger.handlers):
+        logger.removeHandler(h)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(_cfg_log_level())
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+
+
+def _stop_logging():
+    """Flush pending records and stop the listener thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    for h in list(logger.handlers):
+        logger.removeHandler(h)
+
+
 # Globals
 _app = None
 _ui = None
 _server = None
 _server_thread = None
 _registry = None
+# Fusion's API is not reentrant: requests are served concurrently, but action
+# execution is serialized. /health only tries it, without waiting, when its
+# cached Fusion state has expired.
+_registry_lock = threading.Lock()
 
 
 def run(context):
@@ -96,14 +215,15 @@ def run(context):
     global _app, _ui
     _app = adsk.core.Application.get()
     _ui = _app.userInterface
+    _start_logging()
 
     try:
         start_server()
         host, port = _get_bind_addr()
         if _dev_mode:
-            print(f"[BRIDGE] FusionMCPBridge started on http://{host}:{port} (DEV MODE: {_here})")
+            logger.info("FusionMCPBridge started on http://%s:%s (DEV MODE: %s)", host, port, _here)
         else:
-            print(f"[BRIDGE] FusionMCPBridge started on http://{host}:{port}")
+            logger.info("FusionMCPBridge started on http://%s:%s", host, port)
 
     except OSError as e:
         # Handle specific OS errors with helpful messages
@@ -147,6 +267,7 @@ def stop(context):
         
         if _server:
             _server.shutdown()
+            _server.server_close()
             _server = None
             
         if _server_thread:
@@ -154,209 +275,346 @@ def stop(context):
             _server_thread = None
         
         # Drop references to help GC
+        if _registry:
+            _registry.close()
         _registry = None
+        BridgeRequestHandler._registry = None
         
         # Purge bridge modules so next start() picks up code changes without Fusion restart
         _purge_bridge_modules()
         
-        print("[BRIDGE] FusionMCPBridge stopped and modules purged")
+        logger.info("FusionMCPBridge stopped and modules purged")
+        _stop_logging()
         
     except Exception as e:
         if _ui:
             _ui.messageBox(f"Error stopping FusionMCPBridge: {str(e)}")
 
 
-def make_handler_class(registry):
-    """Factory to create handler class with bound registry"""
-    class BridgeRequestHandler(BaseHTTPRequestHandler):
-        _registry = registry
-
-        def log_message(self, format, *args):
-            """Override to suppress default logging"""
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that serves connections on a bounded, pre-sized worker pool"""
+
+    def __init__(self, server_address, handler_class, max_workers: int):
+        # Pool must exist before super().__init__, which calls server_close() if bind fails
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bridge-http")
+        # Open connection sockets, so server_close() can unblock workers parked on them
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+        super().__init__(server_address, handler_class)
+
+    def server_bind(self):
+        """Tune the listening socket before binding"""
+        # Accepted sockets inherit these on most platforms; the handler re-applies TCP_NODELAY
+        try:
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 256 * 1024)
+        except OSError:
             pass
-
-        def _check_auth(self) -> bool:
-            """Check authorization if enabled"""
-            auth_token = _cfg_auth_token()
-            if auth_token is None:
-                return True  # Auth disabled
-            
-            token = self.headers.get("X-Bridge-Token")
-            if token != auth_token:
-                self._send_error(200, "E_UNAUTHORIZED", "Invalid or missing X-Bridge-Token header")
-                return False
-            return True
-
-        def do_GET(self):
-            """Handle GET requests"""
+        super().server_bind()
+
+    def process_request(self, request, client_address):
+        """Hand the connection to a worker instead of serving it inline"""
+        with self._connections_lock:
+            self._connections.add(request)
+        self._pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self._connections_lock:
+                self._connections.discard(request)
+            self.shutdown_request(request)
+
+    def server_close(self):
+        """Close the listener, wake workers blocked on client sockets, then join them"""
+        super().server_close()
+        with self._connections_lock:
+            open_connections = list(self._connections)
+        for conn in open_connections:
             try:
-                if not self._check_auth():
-                    return
-                    
-                parsed = urlparse(self.path)
-                
-                if parsed.path == "/health":
-                    fusion = get_fusion_state()
-                    ver = _cfg_version()
-                    body = {
-                        "status": "ok",
-                        "version": ver,
-                        "fusion": fusion
-                    }
-                    if _dev_mode:
-                        body["dev_mode"] = True
-                        body["dev_path"] = _here
-                    self._send_json_response(200, body)
-                else:
-                    self._send_json_response(404, {
-                        "status": "error",
-                        "error": {"code": "E_NOT_FOUND", "message": "Endpoint not found"}
-                    })
-                    
-            except Exception as e:
-                self._send_json_response(500, {
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        # Connections whose worker was cancelled before it started are still open
+        with self._connections_lock:
+            open_connections = list(self._connections)
+            self._connections.clear()
+        for conn in open_connections:
+            self.shutdown_request(conn)
+
+
+class BridgeRequestHandler(BaseHTTPRequestHandler):
+    """Bridge HTTP handler; per-generation state is rebound by _bind_registry()"""
+    _registry = None
+    # Auth snapshot, refreshed on /dev/reload
+    _auth_enabled = False
+    _auth_token = None
+    # Bound per reload generation so catches match reloaded modules
+    _ValidationError = Exception
+    _FusionAPIError = Exception
+    _ActionNotSupportedError = Exception
+    # Constant parts of the /health body around the "fusion" value
+    _health_prefix = b""
+    _health_suffix = b""
+    # Keep-alive: every response carries Content-Length, so clients can reuse the socket
+    protocol_version = "HTTP/1.1"
+    # TCP_NODELAY on each connection: small JSON replies must not wait on Nagle/delayed-ACK
+    disable_nagle_algorithm = True
+    # Idle keep-alive connections are dropped after this many seconds so they
+    # don't pin pool workers (socket timeout; see _bind_registry)
+    timeout = 10.0
+
+    def log_message(self, format, *args):
+        """Override to suppress default logging"""
+        pass
+
+    def _check_auth(self) -> bool:
+        """Check authorization if enabled"""
+        if not self._auth_enabled:
+            return True  # Auth disabled
+
+        token = (self.headers.get("X-Bridge-Token") or "").encode("utf-8")
+        if not hmac.compare_digest(token, self._auth_token):
+            self._send_error(200, "E_UNAUTHORIZED", "Invalid or missing X-Bridge-Token header")
+            return False
+        return True
+
+    def _route_path(self) -> str:
+        """Request path without query string or trailing slash"""
+        raw = self.path
+        q = raw.find("?")
+        path = raw if q < 0 else raw[:q]
+        return path.rstrip("/")
+
+    def do_GET(self):
+        """Handle GET requests"""
+        try:
+            if not self._check_auth():
+                return
+
+            route = self._GET_ROUTES.get(self._route_path())
+            if route is None:
+                self._send_json_response(404, {
                     "status": "error",
-                    "error": {"code": "E_INTERNAL", "message": str(e)}
+                    "error": {"code": "E_NOT_FOUND", "message": "Endpoint not found"}
                 })
+                return
+            route(self)
+
+        except Exception as e:
+            self._send_json_response(500, {
+                "status": "error",
+                "error": {"code": "E_INTERNAL", "message": str(e)}
+            })
+
+    def do_POST(self):
+        """Handle POST requests - always return 200"""
+        try:
+            if not self._check_auth():
+                # Unread request body would corrupt the next request on this connection
+                self.close_connection = True
+                return
+
+            route = self._POST_ROUTES.get(self._route_path())
+            if route is None:
+                self.close_connection = True
+                self._send_error(200, "E_NOT_FOUND", "Endpoint not found")
+                return
+            route(self)
+
+        except Exception as e:
+            self.close_connection = True
+            self._send_error(200, "E_RUNTIME", str(e))
+
+    def _handle_health(self):
+        """GET /health - only the Fusion state is encoded per request"""
+        blob = self._health_prefix + _json_bytes(get_fusion_state()) + self._health_suffix
+        self._send_body(200, blob)
+
+    def _handle_reload(self):
+        """POST /dev/reload - hot-reload split modules"""
+        self.close_connection = True
+        if not _is_dev_reload_enabled():
+            self._send_error(200, "E_UNAUTHORIZED", "Dev reload disabled (set BRIDGE_DEV_RELOAD=1 or config.DEV_RELOAD_ENABLED=True)")
+            return
+        try:
+            with _registry_lock:
+                _bind_registry(_reload_and_rebuild_registry())
+            self._send_json_response(200, {"status": "ok", "reloaded": True})
+        except Exception as e:
+            self._send_error(200, "E_RUNTIME", str(e))
+
+    def _handle_execute(self):
+        """POST /v1/execute"""
+        body_read = False
+        req = None
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+            if content_length <= 0:
+                self._send_error(200, "E_BAD_ARGS", "Missing request body")
+                return
+
+            # Both parsers take bytes directly, skipping a decoded str copy of the body
+            payload = self.rfile.read(content_length)
+            body_read = True
+            req = _json_loads(payload)
+            action = req.get("action")
+            args = req.get("args", {})
+            request_id = req.get("id")
+
+            if not action:
+                self._send_error(200, "E_BAD_ARGS", "Missing 'action' field", request_id=request_id)
+                return
+
+            start_ns = time.perf_counter_ns()
+            req_id_str = request_id if request_id else "none"
 
-        def do_POST(self):
-            """Handle POST requests - always return 200"""
             try:
-                if not self._check_auth():
-                    return
-                    
-                parsed = urlparse(self.path)
-                
-                # Dev reload endpoint (hot-reload split modules)
-                if parsed.path == "/dev/reload":
-                    if not _is_dev_reload_enabled():
-                        self._send_error(200, "E_UNAUTHORIZED", "Dev reload disabled (set BRIDGE_DEV_RELOAD=1 or config.DEV_RELOAD_ENABLED=True)")
-                        return
-                    try:
-                        new_registry = _reload_and_rebuild_registry()
-                        # Swap registry on current handler class
-                        self.__class__._registry = new_registry
-                        # Also rebuild the RequestHandlerClass so future connections use a fresh class binding
-                        try:
-                            self.server.RequestHandlerClass = make_handler_class(new_registry)
-                        except Exception:
-                            pass
-                        # Update global reference as well
-                        global _registry
-                        _registry = new_registry
-                        self._send_json_response(200, {"status": "ok", "reloaded": True})
-                    except Exception as e:
-                        self._send_error(200, "E_RUNTIME", str(e))
-                    return
-                
-                if parsed.path != "/v1/execute":
-                    self._send_error(200, "E_NOT_FOUND", "Endpoint not found")
-                    return
-
-                content_length = int(self.headers.get("Content-Length", 0))
-                if content_length <= 0:
-                    self._send_error(200, "E_BAD_ARGS", "Missing request body")
-                    return
-
-                payload = self.rfile.read(content_length).decode("utf-8")
-                req = json.loads(payload)
-                action = req.get("action")
-                args = req.get("args", {})
-                request_id = req.get("id")
-
-                if not action:
-                    self._send_error(200, "E_BAD_ARGS", "Missing 'action' field", request_id=request_id)
-                    return
-
-                start = time.time()
-                req_id_str = request_id if request_id else "none"
-                
-                # Import fresh error classes so catches match reloaded modules
-                _errors = import_module('core.errors')
-                ValidationError = getattr(_errors, 'ValidationError', Exception)
-                FusionAPIError = getattr(_errors, 'FusionAPIError', Exception)
-                ActionNotSupportedError = getattr(_errors, 'ActionNotSupportedError', Exception)
-                
-                try:
+                with _registry_lock:
                     result = self._registry.handle_action(action, args)
-                    elapsed = int((time.time() - start) * 1000)
-                    print(f"[BRIDGE] {action} {req_id_str} -> OK ({elapsed}ms)")
-                    
-                    resp = {"status": "ok", "result": result}
-                    if request_id:
-                        resp["id"] = request_id
-                    self._send_json_response(200, resp)
-                    
-                except ActionNotSupportedError as e:
-                    elapsed = int((time.time() - start) * 1000)
-                    print(f"[BRIDGE] {action} {req_id_str} -> ERR ({elapsed}ms): {str(e)}")
-                    self._send_error(200, e.code, e.message, request_id=request_id)
-                except ValidationError as e:
-                    elapsed = int((time.time() - start) * 1000)
-                    print(f"[BRIDGE] {action} {req_id_str} -> ERR ({elapsed}ms): {str(e)}")
-                    self._send_error(200, e.code, e.message, getattr(e, "details", None), request_id)
-                except FusionAPIError as e:
-                    elapsed = int((time.time() - start) * 1000)
-                    print(f"[BRIDGE] {action} {req_id_str} -> ERR ({elapsed}ms): {str(e)}")
-                    self._send_error(200, e.code, e.message, getattr(e, "details", None), request_id)
-                except Exception as e:
-                    elapsed = int((time.time() - start) * 1000)
-                    print(f"[BRIDGE] {action} {req_id_str} -> ERR ({elapsed}ms): {str(e)}")
-                    self._send_error(200, "E_RUNTIME", str(e), request_id=request_id)
-
-            except json.JSONDecodeError as e:
-                self._send_error(200, "E_BAD_JSON", f"Invalid JSON: {str(e)}")
+                elapsed = (time.perf_counter_ns() - start_ns) // 1_000_000
+                logger.info("%s %s -> OK (%sms)", action, req_id_str, elapsed)
+
+                resp = {"status": "ok", "result": result}
+                if request_id:
+                    resp["id"] = request_id
+                self._send_json_response(200, resp)
+
+            except self._ActionNotSupportedError as e:
+                elapsed = (time.perf_counter_ns() - start_ns) // 1_000_000
+                logger.info("%s %s -> ERR (%sms): %s", action, req_id_str, elapsed, e)
+                self._send_error(200, e.code, e.message, request_id=request_id)
+            except self._ValidationError as e:
+                elapsed = (time.perf_counter_ns() - start_ns) // 1_000_000
+                logger.info("%s %s -> ERR (%sms): %s", action, req_id_str, elapsed, e)
+                self._send_error(200, e.code, e.message, getattr(e, "details", None), request_id)
+            except self._FusionAPIError as e:
+                elapsed = (time.perf_counter_ns() - start_ns) // 1_000_000
+                logger.info("%s %s -> ERR (%sms): %s", action, req_id_str, elapsed, e)
+                self._send_error(200, e.code, e.message, getattr(e, "details", None), request_id)
             except Exception as e:
-                # Try to get request_id from parsed data if available
-                try:
-                    request_id = req.get("id") if 'req' in locals() else None
-                except:
-                    request_id = None
+                elapsed = (time.perf_counter_ns() - start_ns) // 1_000_000
+                logger.info("%s %s -> ERR (%sms): %s", action, req_id_str, elapsed, e)
                 self._send_error(200, "E_RUNTIME", str(e), request_id=request_id)
 
-        def _send_json_response(self, status_code, data):
-            """Send JSON response"""
-            blob = json.dumps(data, indent=2).encode("utf-8")
-            
-            self.send_response(status_code)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(blob)))
-            self.send_header("Access-Control-Allow-Origin", "*")
-            self.end_headers()
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            self._send_error(200, "E_BAD_JSON", f"Invalid JSON: {str(e)}")
+        except Exception as e:
+            if not body_read:
+                self.close_connection = True
+            # Try to get request_id from parsed data if available
+            request_id = req.get("id") if isinstance(req, dict) else None
+            self._send_error(200, "E_RUNTIME", str(e), request_id=request_id)
+
+    # Fixed routes: dict lookup instead of parsing the URL and comparing paths
+    _GET_ROUTES = {"/health": _handle_health}
+    _POST_ROUTES = {"/v1/execute": _handle_execute, "/dev/reload": _handle_reload}
+
+    def _response_head(self, status_code, content_length: int) -> bytes:
+        """Status line and headers for a JSON response"""
+        reason = self.responses.get(status_code, ("",))[0]
+        connection = "close" if self.close_connection else "keep-alive"
+        return (
+            f"{self.protocol_version} {status_code} {reason}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {content_length}\r\n"
+            "Access-Control-Allow-Origin: *\r\n"
+            f"Connection: {connection}\r\n"
+            "\r\n"
+        ).encode("latin-1")
+
+    def _send_json_response(self, status_code, data):
+        """Send JSON response; small bodies go out with their headers in one write"""
+        if orjson is not None:
+            blob = _json_bytes(data)
+        else:
+            text = json.dumps(data, separators=(",", ":"))
+            if len(text) > _COALESCE_LIMIT:
+                self._send_json_text_in_slices(status_code, text)
+                return
+            blob = text.encode("ascii")
+        self._send_body(status_code, blob)
+
+    def _send_body(self, status_code, blob: bytes):
+        """Send an already-encoded JSON body"""
+        head = self._response_head(status_code, len(blob))
+        if len(blob) <= _COALESCE_LIMIT:
+            self.wfile.write(head + blob)
+        else:
+            # Avoid copying large bodies just to save one send()
+            self.wfile.write(head)
             self.wfile.write(blob)
 
-        def _send_error(self, status_code, code, message, details=None, request_id=None):
-            """Send structured error response"""
-            body = {
-                "status": "error",
-                "error": {
-                    "code": code,
-                    "message": message
-                }
+    def _send_json_text_in_slices(self, status_code, text: str):
+        """Write a large stdlib-encoded body without materializing a second full copy as bytes.
+
+        json.dumps escapes non-ASCII by default, so the character count is the byte count.
+        """
+        self.wfile.write(self._response_head(status_code, len(text)))
+        for i in range(0, len(text), _COALESCE_LIMIT):
+            self.wfile.write(text[i:i + _COALESCE_LIMIT].encode("ascii"))
+
+    def _send_error(self, status_code, code, message, details=None, request_id=None):
+        """Send structured error response"""
+        body = {
+            "status": "error",
+            "error": {
+                "code": code,
+                "message": message
             }
-            
-            if details:
-                body["error"]["details"] = details
-            if request_id:
-                body["id"] = request_id
-                
-            # Contract: always 200 for POST errors
-            self._send_json_response(200, body)
+        }
 
-    return BridgeRequestHandler
+        if details:
+            body["error"]["details"] = details
+        if request_id:
+            body["id"] = request_id
+
+        # Contract: always 200 for POST errors
+        self._send_json_response(200, body)
+
+
+def _bind_registry(registry):
+    """Point BridgeRequestHandler (and the global) at a registry and its reload generation"""
+    global _registry
+    previous = _registry
+    _registry = registry
+    if previous is not None and previous is not registry:
+        previous.close()
+    cls = BridgeRequestHandler
+    cls._registry = registry
+    (cls._ValidationError, cls._FusionAPIError,
+     cls._ActionNotSupportedError) = _get_error_classes()
+    cls._auth_token = _auth_token_bytes()
+    cls._auth_enabled = cls._auth_token is not None
+    cls.timeout = _cfg_keepalive_timeout()
+    cls._health_prefix, cls._health_suffix = _build_health_template()
+
+
+def _build_health_template():
+    """Prebuild the /health body around its only dynamic field, "fusion"."""
+    prefix = b'{"status":"ok","version":' + _json_bytes(_cfg_version()) + b',"fusion":'
+    suffix = b'}'
+    if _dev_mode:
+        suffix = b',"dev_mode":true,"dev_path":' + _json_bytes(_here) + suffix
+    return prefix, suffix
 
 
 def start_server():
     """Start the HTTP server in a background thread"""
-    global _server, _server_thread, _registry
+    global _server, _server_thread
     
     try:
         # Initialize registry (no feature flags) with fresh imports
-        _registry = _reload_and_rebuild_registry()
+        _bind_registry(_reload_and_rebuild_registry())
 
-        handler_class = make_handler_class(_registry)
         host, port = _get_bind_addr()
-        _server = HTTPServer((host, port), handler_class)
+        # Worker pool so a slow action doesn't block /health probes
+        _server = PooledHTTPServer((host, port), BridgeRequestHandler, _cfg_http_threads())
         _server_thread = threading.Thread(target=_server.serve_forever, daemon=True)
         _server_thread.start()
         
@@ -364,8 +622,29 @@ def start_server():
         raise Exception(f"Failed to start server: {str(e)}")
 
 
+# /health is polled aggressively; Fusion state is reused for this many seconds
+_HEALTH_TTL = 0.5
+_HEALTH_CACHE = {"t": 0.0, "v": None}
+
+
 def get_fusion_state():
-    """Get current Fusion 360 state for health check"""
+    """Get current Fusion 360 state for health check (cached for _HEALTH_TTL seconds)
+
+    Fusion is only queried under _registry_lock. While an action holds it the
+    last cached state is returned with "stale": true instead of waiting.
+    """
+    now = time.monotonic()
+    cached = _HEALTH_CACHE["v"]
+    if cached is not None and now - _HEALTH_CACHE["t"] < _HEALTH_TTL:
+        return cached
+    if not _registry_lock.acquire(blocking=False):
+        if cached is not None:
+            return dict(cached, stale=True)
+        return {
+            "running": True,
+            "stale": True,
+            "units": "unknown"
+        }
     try:
         app = adsk.core.Application.get()
         design = app.activeProduct
@@ -382,46 +661,87 @@ def get_fusion_state():
             if um:
                 info["units"] = um.defaultLengthUnits
                 
+        _HEALTH_CACHE["t"] = now
+        _HEALTH_CACHE["v"] = info
         return info
         
     except Exception as e:
+        # Failures are not cached so a transient error clears on the next probe
         return {
             "running": False,
             "error": str(e),
             "units": "unknown"
         }
+    finally:
+        _registry_lock.release()
+
+
+# Source file mtimes from the previous purge, used to decide whether finder caches are stale
+_file_mtimes = {}
+
+
+def _scan_source_mtimes(root: str) -> dict:
+    """Map each .py file under root to its st_mtime_ns."""
+    mtimes = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        for fn in filenames:
+            if fn.endswith(".py"):
+                path = os.path.join(dirpath, fn)
+                try:
+                    mtimes[path] = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+    return mtimes
+
+
+def _is_bridge_module(module, root: str) -> bool:
+    f = getattr(module, "__file__", None)
+    if not f:
+        return False
+    try:
+        f_abs = os.path.abspath(f)
+    except Exception:
+        return False
+    return f_abs.startswith(root) and not f_abs.endswith("FusionMCPBridge.py")
 
 
 def _purge_bridge_modules():
     """Remove all modules under this add-in directory from sys.modules and invalidate caches."""
+    global _file_mtimes
     try:
         root = os.path.abspath(os.path.dirname(__file__))
-        victims = []
-        for name, m in list(sys.modules.items()):
-            f = getattr(m, "__file__", None)
-            if not f:
-                continue
-            try:
-                f_abs = os.path.abspath(f)
-            except Exception:
-                continue
-            if f_abs.startswith(root) and not f_abs.endswith("FusionMCPBridge.py"):
-                victims.append(name)
+        # Decided at purge time, so modules imported outside a registry rebuild go too
+        victims = [name for name, m in list(sys.modules.items()) if _is_bridge_module(m, root)]
         for name in victims:
             sys.modules.pop(name, None)
-        invalidate_caches()
-        print(f"[BRIDGE] Purged {len(victims)} modules under {root}")
+        # Edits to existing files don't need finder caches rebuilt; only added/removed files do
+        mtimes = _scan_source_mtimes(root)
+        if not _file_mtimes or mtimes.keys() != _file_mtimes.keys():
+            invalidate_caches()
+        _file_mtimes = mtimes
+        logger.info("Purged %d modules under %s", len(victims), root)
     except Exception as e:
-        print(f"[BRIDGE] Module purge error: {e}")
+        logger.error("Module purge error: %s", e)
 
 
 def _reload_and_rebuild_registry():
     """Purge bridge modules, re-import split modules, and return a fresh HandlerRegistry."""
+    global _CFG_MOD, _ERROR_CLASSES
     _purge_bridge_modules()
+    _CFG_MOD = None
+    _ERROR_CLASSES = None
+    _HEALTH_CACHE["v"] = None
+    logger.setLevel(_cfg_log_level())
     # Fresh imports
     core_router = import_module('core.router')
     services_fc = import_module('services.fusion_context')
     HandlerRegistry = getattr(core_router, 'HandlerRegistry')
     FusionContext = getattr(services_fc, 'FusionContext')
     context = FusionContext()
+    try:
+        context.subscribe_events()
+    except Exception as e:
+        # Without events the context simply doesn't cache active objects
+        logger.warning("Fusion event subscription failed: %s", e)
     return HandlerRegistry(context)
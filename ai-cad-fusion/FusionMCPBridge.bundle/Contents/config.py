@@ -7,6 +7,9 @@ BRIDGE_HOST = "0.0.0.0"
 BRIDGE_PORT = 18080
 BRIDGE_VERSION = "0.1.0"
 BRIDGE_DEV_RELOAD = 1
+BRIDGE_HTTP_THREADS = 8  # Worker threads serving HTTP connections
+BRIDGE_KEEPALIVE_TIMEOUT = 10  # Seconds an idle keep-alive connection may hold a worker
+BRIDGE_LOG_LEVEL = "INFO"  # Set to "WARNING" to silence per-request logs
 # Auth configuration (set to None to disable auth)
 BRIDGE_AUTH_TOKEN = None  # Set to string to enable auth
 
@@ -64,7 +64,13 @@ class HandlerRegistry:
         
         try:
             # Feature handlers
-            from handlers.features import ExtrudeProfileHandler, RevolveProfileHandler, CombineBodiesHandler, RotateBodyHandler
+            from handlers.features import (
+                ExtrudeProfileHandler,
+                RevolveProfileHandler,
+                CombineBodiesHandler,
+                RotateBodyHandler,
+                RotateBodiesBatchHandler
+            )
             print("[ROUTER] Feature handlers imported successfully")
         except Exception as e:
             print(f"[ROUTER] Failed to import feature handlers: {e}")
@@ -99,7 +105,8 @@ class HandlerRegistry:
             from handlers.context import (
                 GetEditContextHandler,
                 GetSketchStateHandler,
-                GetCameraStateHandler
+                GetCameraStateHandler,
+                GetAllContextHandler
             )
             print("[ROUTER] Context handlers imported successfully")
         except Exception as e:
@@ -129,6 +136,14 @@ class HandlerRegistry:
         except Exception as e:
             print(f"[ROUTER] Failed to import viewport handlers: {e}")
             raise
+
+        try:
+            # Batch handler
+            from handlers.batch import BatchActionsHandler
+            print("[ROUTER] Batch handler imported successfully")
+        except Exception as e:
+            print(f"[ROUTER] Failed to import batch handler: {e}")
+            raise
         
         # Register Phase 1 proof-of-concept handlers
         self.register("get_design_info", GetDesignInfoHandler)
@@ -163,6 +178,7 @@ class HandlerRegistry:
 
         # Register Phase 3 feature handlers
         self.register("rotate_body", RotateBodyHandler)
+        self.register("rotate_bodies", RotateBodiesBatchHandler)
         
         # Register Phase 2 constraint handlers
         self.register("add_constraints", AddConstraintsHandler)
@@ -178,6 +194,7 @@ class HandlerRegistry:
         self.register("get_edit_context", GetEditContextHandler)
         self.register("get_sketch_state", GetSketchStateHandler)
         self.register("get_camera_state", GetCameraStateHandler)
+        self.register("get_all_context", GetAllContextHandler)
 
         # Register selection handlers
         self.register("get_selection", GetSelectionHandler)
@@ -189,6 +206,10 @@ class HandlerRegistry:
         self.register("set_camera", SetCameraHandler)
         self.register("fit_all", FitAllHandler)
 
+        # Register batch handler (dispatches each step back through this registry)
+        self.register("batch_actions", BatchActionsHandler)
+        self._handlers["batch_actions"].registry = self
+
         # Log all registered actions for debugging
         registered_actions = sorted(self._handlers.keys())
         print(f"[ROUTER] ✅ Successfully registered {len(registered_actions)} handlers:")
@@ -207,6 +228,10 @@ class HandlerRegistry:
             # Re-raise to prevent silent failures
             raise
         
+    def close(self):
+        """Release Fusion event subscriptions held by this registry's context"""
+        self._context.unsubscribe_events()
+        
     def get_handler(self, action: str) -> BaseHandler:
         """Get handler for an action"""
         if action not in self._handlers:
@@ -0,0 +1,102 @@
+"""
+Batch handler - runs several actions in one bridge request
+"""
+import logging
+import adsk.fusion
+from handlers.base import BaseHandler
+from core.errors import ActionNotSupportedError, BridgeError, ValidationError
+
+# Child of the bridge logger - level and output follow config.BRIDGE_LOG_LEVEL
+logger = logging.getLogger("FusionMCPBridge.batch")
+
+
+class BatchActionsHandler(BaseHandler):
+    """Handler for batch_actions action - many actions, one request, one timeline group"""
+
+    # Set by HandlerRegistry after registration; steps dispatch back into it
+    registry = None
+
+    def validate(self, args: dict) -> dict:
+        """Validate batch arguments and resolve every step's handler up front"""
+        self.validators.validate_required_fields(args, ["actions"])
+
+        actions = args["actions"]
+        if not isinstance(actions, list) or not actions:
+            raise ValidationError("actions must be a non-empty array", "actions")
+
+        steps = []
+        for i, step in enumerate(actions):
+            if not isinstance(step, dict) or not step.get("action"):
+                raise ValidationError(f"actions[{i}] must be an object with an 'action' field", "actions")
+            action = step["action"]
+            if action == "batch_actions":
+                raise ValidationError("batch_actions cannot be nested", "actions")
+            step_args = step.get("args", {})
+            if not isinstance(step_args, dict):
+                raise ValidationError(f"actions[{i}].args must be an object", "actions")
+            # Unknown actions fail the whole batch before anything runs
+            try:
+                handler = self.registry.get_handler(action)
+            except ActionNotSupportedError:
+                raise ValidationError(f"actions[{i}]: unknown action '{action}'", "actions")
+            steps.append((action, handler, step_args))
+
+        timeline_group = args.get("timelineGroup", True)
+        if not isinstance(timeline_group, bool):
+            raise ValidationError("timelineGroup must be a boolean", "timelineGroup")
+
+        stop_on_error = args.get("stopOnError", True)
+        if not isinstance(stop_on_error, bool):
+            raise ValidationError("stopOnError must be a boolean", "stopOnError")
+
+        return {
+            "steps": steps,
+            "timelineGroup": timeline_group,
+            "stopOnError": stop_on_error
+        }
+
+    def execute(self, args: dict) -> dict:
+        """Run each step in order, then group the timeline entries they created"""
+        app = self.context.app
+        doc = app.activeDocument
+        timeline = self._parametric_timeline(app) if args["timelineGroup"] else None
+        start = timeline.markerPosition if timeline else None
+
+        results = []
+        completed = 0
+        for action, handler, step_args in args["steps"]:
+            try:
+                results.append({"action": action, "status": "ok", "result": handler.handle(step_args)})
+                completed += 1
+            except BridgeError as e:
+                error = {"code": e.code, "message": e.message}
+                if e.details:
+                    error["details"] = e.details
+                results.append({"action": action, "status": "error", "error": error})
+                if args["stopOnError"]:
+                    break
+
+        result = {
+            "completed": completed,
+            "results": results
+        }
+
+        # Collapse the batch into one timeline entry; skipped if a step switched documents
+        if timeline is not None and app.activeDocument == doc:
+            end = timeline.markerPosition - 1
+            if end > start:
+                try:
+                    group = timeline.timelineGroups.add(start, end)
+                    result["timelineGroup"] = group.name
+                except Exception as e:
+                    logger.debug("Timeline grouping failed: %s", e)
+
+        return result
+
+    @staticmethod
+    def _parametric_timeline(app):
+        """Timeline of the active design, or None for direct-modeling or non-design documents"""
+        design = adsk.fusion.Design.cast(app.activeProduct)
+        if design and design.designType == adsk.fusion.DesignTypes.ParametricDesignType:
+            return design.timeline
+        return None
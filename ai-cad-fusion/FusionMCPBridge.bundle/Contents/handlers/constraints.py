@@ -116,6 +116,9 @@ class AddConstraintsHandler(BaseHandler):
             # Not fully supported in v0 (requires point refs). Return E_BAD_ARGS for now
             raise ValidationError("coincident constraint for point refs not yet supported in v0")
         
+        # Only the sketch's contents changed; keep the resolver's name indexes
+        self.context.resolver_cache.sketch_edited(self.context.root_component)
+        
         return {"applied": applied}
 
 
@@ -197,4 +200,7 @@ class AddDimensionDistanceHandler(BaseHandler):
         except Exception:
             pass
         
+        # Only the sketch's contents changed; keep the resolver's name indexes
+        self.context.resolver_cache.sketch_edited(self.context.root_component)
+        
         return {"dimensionName": dim_name or "dimension"}
\ No newline at end of file
@@ -1,118 +1,441 @@
 """
 Context-related handlers - provides agents with awareness of current Fusion state
 """
+import functools
+import logging
+import math
+import operator
 import adsk.core
 import adsk.fusion
 from handlers.base import BaseHandler
 from core.errors import FusionAPIError, ValidationError
 
+# Child of the bridge logger - level and output follow config.BRIDGE_LOG_LEVEL
+logger = logging.getLogger("FusionMCPBridge.context")
+
+# Properties that not every Fusion build exposes - probed once at import
+_CAP_IS_MODIFIED = hasattr(adsk.core.Document, 'isModified')
+_CAP_IS_FULLY_CONSTRAINED = hasattr(adsk.fusion.Sketch, 'isFullyConstrained')
+_CAP_PROFILES = hasattr(adsk.fusion.Sketch, 'profiles')
+_CAP_SKETCH_DIMENSIONS = hasattr(adsk.fusion.Sketch, 'sketchDimensions')
+
+# objectType strings for the edit objects recognised in edit context
+_SKETCH = "adsk::fusion::Sketch"
+_COMPONENT = "adsk::fusion::Component"
+_FORM_FEATURE = "adsk::fusion::FormFeature"
+
+# objectType strings for the sketch curve types counted in sketch state
+_SKETCH_LINE = "adsk::fusion::SketchLine"
+_SKETCH_CIRCLE = "adsk::fusion::SketchCircle"
+_SKETCH_ARC = "adsk::fusion::SketchArc"
+
+# Bulk x/y/z read for points without asArray()
+_XYZ = operator.attrgetter("x", "y", "z")
+
+# Standard views keyed by the packed per-axis code of the view direction
+# (x*16 + y*4 + z, see _axis_code): 1 = +1, 2 = -1, 0 = 0
+_ORIENT_TABLE = {
+    1: "top",
+    2: "bottom",
+    4: "front",
+    8: "back",
+    16: "right",
+    32: "left",
+}
+
+# Flat default sections of the sketch state payload, copied per call
+_CONSTRAINT_HEALTH_TEMPLATE = {"totalDOF": 0, "underconstrainedEntities": 0}
+_ENTITIES_TEMPLATE = {"lines": 0, "circles": 0, "arcs": 0, "points": 0, "construction": 0}
+
+# Fusion geometric constraint classes counted in sketch state
+_CONSTRAINT_CLASS_NAMES = (
+    "CoincidentConstraint",
+    "CollinearConstraint",
+    "ConcentricConstraint",
+    "EqualConstraint",
+    "HorizontalConstraint",
+    "HorizontalPointsConstraint",
+    "MidPointConstraint",
+    "ParallelConstraint",
+    "PerpendicularConstraint",
+    "SmoothConstraint",
+    "SymmetryConstraint",
+    "TangentConstraint",
+    "VerticalConstraint",
+    "VerticalPointsConstraint",
+    "OffsetConstraint",
+    "PolygonConstraint",
+    "CircularPatternConstraint",
+    "RectangularPatternConstraint",
+    "CoincidentToSurfaceConstraint",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _class_has(cls, name: str) -> bool:
+    """hasattr() probed once per Fusion proxy class instead of on every call"""
+    return hasattr(cls, name)
+
+
+def _constraint_label(cls) -> str:
+    """Simplified label for a constraint class, e.g. HorizontalConstraint -> horizontal"""
+    return cls.__name__.replace("Sketch", "").replace("Constraint", "").lower()
+
+
+def _constraint_slot_table():
+    """(class -> slot index, slot index -> label) for the constraint classes this Fusion build has"""
+    classes = [
+        cls for cls in (getattr(adsk.fusion, name, None) for name in _CONSTRAINT_CLASS_NAMES)
+        if isinstance(cls, type)  # Older Fusion builds lack some constraint types
+    ]
+    return ({cls: i for i, cls in enumerate(classes)},
+            tuple(_constraint_label(cls) for cls in classes))
+
+
+# Constraint class -> slot index, and slot index -> label, so counting is a
+# list increment per constraint
+CONSTRAINT_TYPE_IDX, CONSTRAINT_SLOT_LABELS = _constraint_slot_table()
+
+
+# Shared builders - take already-resolved Fusion references so get_all_context
+# can fetch app/design/edit object/viewport once for all three sections
+
+
+def _build_edit_context(active_doc, design, edit_obj, selection_count: int) -> dict:
+    """Build the get_edit_context payload"""
+    result = {
+        "document": None,
+        "activeComponent": None,
+        "editMode": None,
+        "selectionCount": selection_count
+    }
+
+    # Document info
+    if active_doc:
+        result["document"] = {
+            "name": active_doc.name,
+            "designType": "parametric" if (design and design.designType == adsk.fusion.DesignTypes.ParametricDesignType) else "direct",
+            "hasUnsavedChanges": active_doc.isModified if _CAP_IS_MODIFIED else False
+        }
+
+    # Active component
+    if design:
+        active_comp = design.activeComponent
+        if active_comp:
+            result["activeComponent"] = {
+                "name": active_comp.name,
+                "isRoot": active_comp == design.rootComponent
+            }
 
-class GetEditContextHandler(BaseHandler):
-    """Handler for get_edit_context action - lightweight summary of current state"""
+    # Edit mode detection
+    if edit_obj:
+        result["editMode"] = _detect_edit_mode(edit_obj)
+    else:
+        result["editMode"] = {"type": "model"}
 
-    def validate(self, args: dict) -> dict:
-        """No arguments needed"""
-        return args
+    return result
 
-    def execute(self, args: dict) -> dict:
-        """Get current editing context"""
+
+def _detect_edit_mode(edit_obj) -> dict:
+    """Detect what type of object is being edited"""
+    # Dispatch on the objectType string so only the matching type is cast
+    object_type = edit_obj.objectType
+
+    # Check if it's a sketch
+    if object_type == _SKETCH:
+        sketch = adsk.fusion.Sketch.cast(edit_obj)
+        plane_name = "custom"
         try:
-            app = self.context.app
-            ui = app.userInterface
+            # Try to determine sketch plane
+            ref_plane = sketch.referencePlane
+            if ref_plane:
+                if _class_has(type(ref_plane), 'name'):
+                    plane_name = ref_plane.name
+        except:
+            pass
 
-            result = {
-                "document": None,
-                "activeComponent": None,
-                "editMode": None,
-                "selectionCount": 0
-            }
+        return {
+            "type": "sketch",
+            "target": sketch.name,
+            "sketchPlane": plane_name
+        }
 
-            # Document info
-            active_doc = app.activeDocument
-            if active_doc:
-                design = adsk.fusion.Design.cast(app.activeProduct)
-                result["document"] = {
-                    "name": active_doc.name,
-                    "designType": "parametric" if (design and design.designType == adsk.fusion.DesignTypes.ParametricDesignType) else "direct",
-                    "hasUnsavedChanges": getattr(active_doc, 'isModified', False)
-                }
-
-            # Active component
-            if design:
-                active_comp = design.activeComponent
-                if active_comp:
-                    result["activeComponent"] = {
-                        "name": active_comp.name,
-                        "isRoot": active_comp == design.rootComponent
-                    }
-
-            # Edit mode detection
-            edit_obj = app.activeEditObject
-            if edit_obj:
-                edit_mode = self._detect_edit_mode(edit_obj)
-                result["editMode"] = edit_mode
-            else:
-                result["editMode"] = {"type": "model"}
+    # Check if it's a component
+    if object_type == _COMPONENT:
+        component = adsk.fusion.Component.cast(edit_obj)
+        return {
+            "type": "component",
+            "target": component.name
+        }
 
-            # Selection count
-            if ui and ui.activeSelections:
-                result["selectionCount"] = ui.activeSelections.count
+    # Check for form (T-spline) editing
+    if object_type == _FORM_FEATURE:
+        form = adsk.fusion.FormFeature.cast(edit_obj)
+        return {
+            "type": "form",
+            "target": form.name if _class_has(type(form), 'name') else "Form"
+        }
+
+    # Default to model editing
+    return {"type": "model"}
 
-            return result
 
+def _build_sketch_state(target_sketch, detailed: bool) -> dict:
+    """Build the get_sketch_state payload for a resolved sketch"""
+    # Sections are gathered into locals and the payload is assembled once at the end
+
+    # Count profiles; profile computation can fail on broken sketch geometry,
+    # which is reported as 0 rather than failing the whole call
+    profile_count = 0
+    if _CAP_PROFILES:
+        try:
+            profile_count = target_sketch.profiles.count
         except Exception as e:
-            raise FusionAPIError(f"Failed to get edit context: {str(e)}")
+            logger.debug("Error counting profiles: %s", e)
+
+    # Count entities by type
+    entities = _ENTITIES_TEMPLATE.copy()
+    try:
+        curves = target_sketch.sketchCurves
+        if not detailed:
+            # Collection counts only - no per-curve API calls
+            entities["lines"] = curves.sketchLines.count
+            entities["circles"] = curves.sketchCircles.count
+            entities["arcs"] = curves.sketchArcs.count
+            entities["construction"] = None
+        elif curves.count:
+            # One pass over the flat curve collection instead of an
+            # indexed loop per curve type; empty sketches keep the zeros
+            line_ct = circle_ct = arc_ct = cons_ct = 0
+            for curve in curves:
+                object_type = curve.objectType
+                if object_type == _SKETCH_LINE:
+                    line_ct += 1
+                elif object_type == _SKETCH_CIRCLE:
+                    circle_ct += 1
+                elif object_type == _SKETCH_ARC:
+                    arc_ct += 1
+                else:
+                    continue
+                if curve.isConstruction:
+                    cons_ct += 1
+
+            entities["lines"] = line_ct
+            entities["circles"] = circle_ct
+            entities["arcs"] = arc_ct
+            entities["construction"] = cons_ct
+
+        # Points
+        points = target_sketch.sketchPoints
+        entities["points"] = points.count
+
+    except Exception as e:
+        logger.debug("Error counting entities: %s", e)
+
+    # Count constraints by type
+    constraint_counts = {}
+    try:
+        constraints = target_sketch.geometricConstraints
+        if detailed:
+            type_idx = CONSTRAINT_TYPE_IDX
+            slots = [0] * len(CONSTRAINT_SLOT_LABELS)
+            # Classes missing from the table, counted by class for this call only
+            unlisted = {}
+            for cls in map(type, constraints):
+                index = type_idx.get(cls)
+                if index is None:
+                    unlisted[cls] = unlisted.get(cls, 0) + 1
+                else:
+                    slots[index] += 1
+            counted = zip(CONSTRAINT_SLOT_LABELS, slots)
+            if unlisted:
+                counted = list(counted) + [(_constraint_label(cls), n) for cls, n in unlisted.items()]
+            for label, count in counted:
+                if count:
+                    constraint_counts[label] = constraint_counts.get(label, 0) + count
+        else:
+            constraint_counts = {"total": constraints.count}
+
+    except Exception as e:
+        logger.debug("Error counting constraints: %s", e)
+
+    # Count dimensions
+    if _CAP_SKETCH_DIMENSIONS:
+        try:
+            constraint_counts["dimensions"] = target_sketch.sketchDimensions.count
+        except RuntimeError as e:
+            logger.debug("Error counting dimensions: %s", e)
+
+    # Check if fully constrained (approximation - check if any points are underconstrained)
+    # Fusion doesn't directly expose DOF, so we check sketch.isFullyConstrained if available
+    fully_constrained = False
+    if _CAP_IS_FULLY_CONSTRAINED:
+        try:
+            fully_constrained = target_sketch.isFullyConstrained
+        except RuntimeError as e:
+            logger.debug("Error reading isFullyConstrained: %s", e)
+
+    return {
+        "sketchName": target_sketch.name,
+        "plane": _get_plane_name(target_sketch),
+        "isFullyConstrained": fully_constrained,
+        "constraintHealth": _CONSTRAINT_HEALTH_TEMPLATE.copy(),
+        # All profiles in Fusion are closed by definition
+        "profiles": {"count": profile_count, "closed": profile_count, "open": 0},
+        "entities": entities,
+        "constraints": constraint_counts
+    }
+
+
+def _get_plane_name(sketch) -> str:
+    """Get the name of the sketch plane"""
+    try:
+        ref_plane = sketch.referencePlane
+        if ref_plane:
+            # Check if it's a construction plane
+            if _class_has(type(ref_plane), 'name'):
+                return ref_plane.name
+
+            # Check if it's an origin plane
+            plane = adsk.fusion.ConstructionPlane.cast(ref_plane)
+            if plane:
+                return plane.name
+
+        return "custom"
+    except:
+        return "unknown"
+
+
+def _build_camera_state(viewport) -> dict:
+    """Build the get_camera_state payload for a resolved viewport"""
+    # Each camera property read returns a fresh proxy, so fetch every point once
+    camera = viewport.camera
+    camera_cls = type(camera)
+
+    result = {
+        "orientation": None,
+        "isFitAll": camera.isFitView if _class_has(camera_cls, 'isFitView') else False,
+        "viewExtents": camera.viewExtents if _class_has(camera_cls, 'viewExtents') else None
+    }
+    result.update(_camera_geometry(_xyz(camera.eye), _xyz(camera.target), _xyz(camera.upVector)))
+    return result
+
+
+def _xyz(point):
+    """Coordinates of a Point3D/Vector3D as a tuple, or None"""
+    if not point:
+        return None
+    # asArray() fetches all three coordinates in a single API call
+    if _class_has(type(point), 'asArray'):
+        return tuple(point.asArray())
+    return _XYZ(point)
+
+
+@functools.lru_cache(maxsize=32)
+def _camera_geometry(eye, target, up_vector) -> dict:
+    """Orientation and eye/target/upVector sections for the given coordinates
+
+    Cached so an agent re-querying an unmoved view reuses the same dicts; the
+    returned mapping and its point dicts are shared and must not be mutated.
+    """
+    geometry = {"orientation": _detect_orientation(eye, target)}
+
+    # Eye position
+    if eye:
+        geometry["eye"] = {"x": eye[0], "y": eye[1], "z": eye[2]}
+
+    # Target position
+    if target:
+        geometry["target"] = {"x": target[0], "y": target[1], "z": target[2]}
+
+    # Up vector
+    if up_vector:
+        geometry["upVector"] = {"x": up_vector[0], "y": up_vector[1], "z": up_vector[2]}
+
+    return geometry
+
+
+def _detect_orientation(eye, target) -> str:
+    """Detect standard view orientation from camera eye and target coordinates"""
+    if not eye or not target:
+        return "custom"
+
+    # Get view direction (normalized)
+    dx = eye[0] - target[0]
+    dy = eye[1] - target[1]
+    dz = eye[2] - target[2]
+
+    length = math.hypot(dx, dy, dz)
+    if length < 0.001:
+        return "custom"
+
+    dx, dy, dz = dx/length, dy/length, dz/length
+
+    # Standard view: one axis within tolerance of +/-1, the others within
+    # tolerance of 0
+    tolerance = 0.1
+    key = _axis_code(dx, tolerance) * 16 + _axis_code(dy, tolerance) * 4 + _axis_code(dz, tolerance)
+    orientation = _ORIENT_TABLE.get(key)
+    if orientation:
+        return orientation
+
+    # Check for isometric-ish views
+    if abs(dx) > 0.3 and abs(dy) > 0.3 and abs(dz) > 0.3:
+        return "iso"
+
+    return "custom"
+
 
-    def _detect_edit_mode(self, edit_obj) -> dict:
-        """Detect what type of object is being edited"""
-        # Check if it's a sketch
-        sketch = adsk.fusion.Sketch.cast(edit_obj)
-        if sketch:
-            plane_name = "custom"
-            try:
-                # Try to determine sketch plane
-                ref_plane = sketch.referencePlane
-                if ref_plane:
-                    if hasattr(ref_plane, 'name'):
-                        plane_name = ref_plane.name
-            except:
-                pass
-
-            return {
-                "type": "sketch",
-                "target": sketch.name,
-                "sketchPlane": plane_name
-            }
+def _axis_code(component: float, tolerance: float) -> int:
+    """Quantize a unit-vector component: 1 near +1, 2 near -1, 0 near 0, else 3"""
+    if component > 1 - tolerance:
+        return 1
+    if component < tolerance - 1:
+        return 2
+    if -tolerance < component < tolerance:
+        return 0
+    return 3
 
-        # Check if it's a component
-        component = adsk.fusion.Component.cast(edit_obj)
-        if component:
-            return {
-                "type": "component",
-                "target": component.name
-            }
 
-        # Check for form (T-spline) editing
-        form = adsk.fusion.FormFeature.cast(edit_obj)
-        if form:
-            return {
-                "type": "form",
-                "target": form.name if hasattr(form, 'name') else "Form"
-            }
+def _resolve_edit_state(context):
+    """Fetch (active_doc, design, edit_obj, selection_count) with one read each"""
+    ui = context.ui
+    active_doc = context.active_doc
+    design = context.active_design if active_doc else None
+    edit_obj = context.app.activeEditObject
+    selections = ui.activeSelections if ui else None
+    selection_count = selections.count if selections else 0
+    return active_doc, design, edit_obj, selection_count
+
 
-        # Default to model editing
-        return {"type": "model"}
+class GetEditContextHandler(BaseHandler):
+    """Handler for get_edit_context action - lightweight summary of current state"""
+
+    def validate(self, args: dict) -> dict:
+        """No arguments needed"""
+        return args
+
+    def execute(self, args: dict) -> dict:
+        """Get current editing context"""
+        try:
+            return _build_edit_context(*_resolve_edit_state(self.context))
+
+        except Exception as e:
+            raise FusionAPIError(f"Failed to get edit context: {str(e)}")
 
 
 class GetSketchStateHandler(BaseHandler):
     """Handler for get_sketch_state action - detailed sketch info when in sketch edit mode"""
 
     def validate(self, args: dict) -> dict:
-        """Validate arguments - optional sketch name"""
+        """Validate arguments - optional sketch name and detailed flag"""
         sketch_name = args.get("sketch")
         if sketch_name is not None:
             sketch_name = self.validators.validate_non_empty_string(sketch_name, "sketch")
-        return {"sketch": sketch_name}
+        detailed = args.get("detailed")
+        if detailed is not None and not isinstance(detailed, bool):
+            raise ValidationError("detailed must be a boolean")
+        return {"sketch": sketch_name, "detailed": bool(detailed)}
 
     def execute(self, args: dict) -> dict:
         """Get detailed sketch state"""
@@ -134,132 +457,13 @@ class GetSketchStateHandler(BaseHandler):
                 if not target_sketch:
                     raise ValidationError("No sketch specified and not currently editing a sketch")
 
-            # Build sketch state
-            result = {
-                "sketchName": target_sketch.name,
-                "plane": self._get_plane_name(target_sketch),
-                "isFullyConstrained": False,  # Will be updated below
-                "constraintHealth": {
-                    "totalDOF": 0,
-                    "underconstrainedEntities": 0
-                },
-                "profiles": {
-                    "count": 0,
-                    "closed": 0,
-                    "open": 0
-                },
-                "entities": {
-                    "lines": 0,
-                    "circles": 0,
-                    "arcs": 0,
-                    "points": 0,
-                    "construction": 0
-                },
-                "constraints": {}
-            }
-
-            # Count profiles
-            try:
-                profiles = target_sketch.profiles
-                result["profiles"]["count"] = profiles.count
-                # All profiles in Fusion are closed by definition
-                result["profiles"]["closed"] = profiles.count
-            except:
-                pass
-
-            # Count entities by type
-            try:
-                curves = target_sketch.sketchCurves
-                construction_count = 0
-
-                # Lines
-                lines = curves.sketchLines
-                result["entities"]["lines"] = lines.count
-                for i in range(lines.count):
-                    if lines.item(i).isConstruction:
-                        construction_count += 1
-
-                # Circles
-                circles = curves.sketchCircles
-                result["entities"]["circles"] = circles.count
-                for i in range(circles.count):
-                    if circles.item(i).isConstruction:
-                        construction_count += 1
-
-                # Arcs
-                arcs = curves.sketchArcs
-                result["entities"]["arcs"] = arcs.count
-                for i in range(arcs.count):
-                    if arcs.item(i).isConstruction:
-                        construction_count += 1
-
-                result["entities"]["construction"] = construction_count
-
-                # Points
-                points = target_sketch.sketchPoints
-                result["entities"]["points"] = points.count
-
-            except Exception as e:
-                print(f"[CONTEXT] Error counting entities: {e}")
-
-            # Count constraints by type
-            try:
-                constraints = target_sketch.geometricConstraints
-                constraint_counts = {}
-
-                for i in range(constraints.count):
-                    constraint = constraints.item(i)
-                    constraint_type = type(constraint).__name__
-                    # Simplify constraint type names
-                    simple_type = constraint_type.replace("Sketch", "").replace("Constraint", "").lower()
-                    constraint_counts[simple_type] = constraint_counts.get(simple_type, 0) + 1
-
-                result["constraints"] = constraint_counts
-
-            except Exception as e:
-                print(f"[CONTEXT] Error counting constraints: {e}")
-
-            # Count dimensions
-            try:
-                dims = target_sketch.sketchDimensions
-                result["constraints"]["dimensions"] = dims.count
-            except:
-                pass
-
-            # Check if fully constrained (approximation - check if any points are underconstrained)
-            # Fusion doesn't directly expose DOF, so we check sketch.isFullyConstrained if available
-            try:
-                # This property may not exist in all Fusion versions
-                if hasattr(target_sketch, 'isFullyConstrained'):
-                    result["isFullyConstrained"] = target_sketch.isFullyConstrained
-            except:
-                pass
-
-            return result
+            return _build_sketch_state(target_sketch, args.get("detailed", False))
 
         except ValidationError:
             raise
         except Exception as e:
             raise FusionAPIError(f"Failed to get sketch state: {str(e)}")
 
-    def _get_plane_name(self, sketch) -> str:
-        """Get the name of the sketch plane"""
-        try:
-            ref_plane = sketch.referencePlane
-            if ref_plane:
-                # Check if it's a construction plane
-                if hasattr(ref_plane, 'name'):
-                    return ref_plane.name
-
-                # Check if it's an origin plane
-                plane = adsk.fusion.ConstructionPlane.cast(ref_plane)
-                if plane:
-                    return plane.name
-
-            return "custom"
-        except:
-            return "unknown"
-
 
 class GetCameraStateHandler(BaseHandler):
     """Handler for get_camera_state action - current view orientation"""
@@ -271,87 +475,49 @@ class GetCameraStateHandler(BaseHandler):
     def execute(self, args: dict) -> dict:
         """Get current camera/view state"""
         try:
-            app = self.context.app
-            viewport = app.activeViewport
+            viewport = self.context.viewport
 
             if not viewport:
                 raise FusionAPIError("No active viewport")
 
-            camera = viewport.camera
+            return _build_camera_state(viewport)
+
+        except Exception as e:
+            raise FusionAPIError(f"Failed to get camera state: {str(e)}")
+
+
+class GetAllContextHandler(BaseHandler):
+    """Handler for get_all_context action - edit context, sketch state and camera in one call"""
+
+    def validate(self, args: dict) -> dict:
+        """Validate arguments - optional detailed flag for the sketch section"""
+        detailed = args.get("detailed")
+        if detailed is not None and not isinstance(detailed, bool):
+            raise ValidationError("detailed must be a boolean")
+        return {"detailed": bool(detailed)}
+
+    def execute(self, args: dict) -> dict:
+        """Get edit context, active sketch state and camera state together"""
+        try:
+            context = self.context
+            active_doc, design, edit_obj, selection_count = _resolve_edit_state(context)
 
             result = {
-                "orientation": self._detect_orientation(camera),
-                "isFitAll": camera.isFitView if hasattr(camera, 'isFitView') else False,
-                "viewExtents": camera.viewExtents if hasattr(camera, 'viewExtents') else None
+                "editContext": _build_edit_context(active_doc, design, edit_obj, selection_count),
+                "sketchState": None,
+                "cameraState": None
             }
 
-            # Eye position
-            if camera.eye:
-                result["eye"] = {
-                    "x": camera.eye.x,
-                    "y": camera.eye.y,
-                    "z": camera.eye.z
-                }
-
-            # Target position
-            if camera.target:
-                result["target"] = {
-                    "x": camera.target.x,
-                    "y": camera.target.y,
-                    "z": camera.target.z
-                }
-
-            # Up vector
-            if camera.upVector:
-                result["upVector"] = {
-                    "x": camera.upVector.x,
-                    "y": camera.upVector.y,
-                    "z": camera.upVector.z
-                }
+            # Sketch state only applies while a sketch is being edited
+            sketch = adsk.fusion.Sketch.cast(edit_obj) if edit_obj else None
+            if sketch:
+                result["sketchState"] = _build_sketch_state(sketch, args.get("detailed", False))
+
+            viewport = context.viewport
+            if viewport:
+                result["cameraState"] = _build_camera_state(viewport)
 
             return result
 
         except Exception as e:
-            raise FusionAPIError(f"Failed to get camera state: {str(e)}")
-
-    def _detect_orientation(self, camera) -> str:
-        """Detect standard view orientation from camera position"""
-        try:
-            if not camera.eye or not camera.target:
-                return "custom"
-
-            # Get view direction (normalized)
-            dx = camera.eye.x - camera.target.x
-            dy = camera.eye.y - camera.target.y
-            dz = camera.eye.z - camera.target.z
-
-            length = (dx*dx + dy*dy + dz*dz) ** 0.5
-            if length < 0.001:
-                return "custom"
-
-            dx, dy, dz = dx/length, dy/length, dz/length
-
-            # Check for standard views (with tolerance)
-            tolerance = 0.1
-
-            if abs(dz - 1) < tolerance and abs(dx) < tolerance and abs(dy) < tolerance:
-                return "top"
-            if abs(dz + 1) < tolerance and abs(dx) < tolerance and abs(dy) < tolerance:
-                return "bottom"
-            if abs(dy - 1) < tolerance and abs(dx) < tolerance and abs(dz) < tolerance:
-                return "front"
-            if abs(dy + 1) < tolerance and abs(dx) < tolerance and abs(dz) < tolerance:
-                return "back"
-            if abs(dx - 1) < tolerance and abs(dy) < tolerance and abs(dz) < tolerance:
-                return "right"
-            if abs(dx + 1) < tolerance and abs(dy) < tolerance and abs(dz) < tolerance:
-                return "left"
-
-            # Check for isometric-ish views
-            if abs(dx) > 0.3 and abs(dy) > 0.3 and abs(dz) > 0.3:
-                return "iso"
-
-            return "custom"
-
-        except:
-            return "unknown"
+            raise FusionAPIError(f"Failed to get all context: {str(e)}")
@@ -329,6 +329,9 @@ class OpenDocumentHandler(BaseHandler):
                 except TypeError:
                     doc = app.documents.open(path)
             
+            # The active document changed; don't wait for Fusion's event
+            self.context.invalidate()
+            
             if not doc:
                 raise FusionAPIError("Failed to open document")
             
@@ -397,6 +400,7 @@ class FocusDocumentHandler(BaseHandler):
             
             # Activate the document
             target_doc.activate()
+            self.context.invalidate()
             
             return {
                 "documentName": target_doc.name
@@ -433,6 +437,7 @@ class CloseDocumentHandler(BaseHandler):
             
             # Close the document
             active_doc.close(save)
+            self.context.invalidate()
             
             return {
                 "closed": True
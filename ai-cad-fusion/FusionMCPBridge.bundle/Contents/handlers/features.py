@@ -1,131 +1,201 @@
 """
 3D Feature-related handlers
 """
+import functools
+import logging
+import math
+import sys
 import adsk.core
 import adsk.fusion
 from handlers.base import BaseHandler
 from core.errors import ValidationError, FusionAPIError
+from services.validators import schema_validated
 
+# Child of the bridge logger - level and output follow config.BRIDGE_LOG_LEVEL
+logger = logging.getLogger("FusionMCPBridge.features")
 
+_radians = math.radians
+
+# Dispatch strings, interned so validate() can canonicalise client values and
+# execute() can branch with identity checks
+_POSITIVE = sys.intern("positive")
+_NEGATIVE = sys.intern("negative")
+_SYMMETRIC = sys.intern("symmetric")
+_ORIGIN_AXIS = sys.intern("origin_axis")
+_EDGE_AXIS = sys.intern("edge_axis")
+
+
+@functools.lru_cache(maxsize=1)
+def _op_map() -> dict:
+    """Operation name -> FeatureOperations value, built on first use"""
+    ops = adsk.fusion.FeatureOperations
+    return {
+        "new_body": ops.NewBodyFeatureOperation,
+        "join": ops.JoinFeatureOperation,
+        "cut": ops.CutFeatureOperation,
+        "intersect": ops.IntersectFeatureOperation
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _origin_axes() -> tuple:
+    """(origin Point3D, axis name -> unit Vector3D), created on first use and shared
+
+    setToRotation only reads its arguments, so every rotate call can reuse these.
+    """
+    vec = adsk.core.Vector3D.create
+    return adsk.core.Point3D.create(0, 0, 0), {
+        "X": vec(1, 0, 0),
+        "Y": vec(0, 1, 0),
+        "Z": vec(0, 0, 1)
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _origin_rotation_args(axis: str, angle_deg) -> tuple:
+    """(radians, unit Vector3D, origin Point3D) for setToRotation, per (axis, angle)
+
+    Only the inputs are shared; setToRotation reads them without keeping them.
+    """
+    origin, axis_vectors = _origin_axes()
+    return _radians(angle_deg), axis_vectors[axis], origin
+
+
+def _origin_rotation(axis: str, angle_deg):
+    """New Matrix3D rotating angle_deg degrees about an origin axis
+
+    Each call gets its own matrix, so a caller holding one never sees another's changes.
+    """
+    transform = adsk.core.Matrix3D.create()
+    transform.setToRotation(*_origin_rotation_args(axis, angle_deg))
+    return transform
+
+
+# Shared result for handlers with nothing to report but success. Never mutated:
+# MappingProxyType would make that explicit but the JSON encoder rejects it.
+_SUCCESS = {"success": True}
+
+
+def _feature_result(feature_type: str, name: str, bodies=None, created_refs=None) -> dict:
+    """{"feature": {...}} result for a created feature, plus the body lists when provided"""
+    result = {"feature": {"type": feature_type, "name": name}}
+    if bodies:
+        result["bodies"] = bodies
+    if created_refs:
+        result["createdBodies"] = created_refs
+    return result
+
+
+# Origin axis name -> Component construction axis property
+_CONSTRUCTION_AXES = {
+    "X": "xConstructionAxis",
+    "Y": "yConstructionAxis",
+    "Z": "zConstructionAxis"
+}
+
+
+@schema_validated
 class ExtrudeProfileHandler(BaseHandler):
     """Handler for extrude_profile action"""
     
+    SCHEMA = {
+        "sketch": "non_empty_string",
+        "profile_index": "non_negative_int",
+        "distance": "positive_number",
+        "operation": ("operation", "new_body"),
+        "direction": ("direction", "positive"),
+        "returnCreatedBodies": ("bool", False)
+    }
+    
     def validate(self, args: dict) -> dict:
         """Validate extrude profile arguments"""
-        self.validators.validate_required_fields(args, ["sketch", "profile_index", "distance"])
-        
-        # Validate sketch name
-        sketch_name = self.validators.validate_non_empty_string(args["sketch"], "sketch")
-        
-        # Validate profile index
-        profile_index = self.validators.validate_non_negative_int(args["profile_index"], "profile_index")
-        
-        # Validate distance
-        distance = self.validators.validate_positive_number(args["distance"], "distance")
-        
-        # Validate operation (optional)
-        operation = args.get("operation", "new_body")
-        self.validators.validate_operation(operation)
-        
-        # Validate direction (optional)
-        direction = args.get("direction", "positive")
-        self.validators.validate_direction(direction)
-        
-        return {
-            "sketch": sketch_name,
-            "profile_index": profile_index,
-            "distance": distance,
-            "operation": operation,
-            "direction": direction
-        }
+        validated = self._validate_fast(args)
+        validated["operation"] = _op_map()[validated["operation"]]
+        validated["direction"] = sys.intern(validated["direction"])
+        return validated
     
     def execute(self, args: dict) -> dict:
-        """Execute extrude profile action"""
+        """Execute extrude profile action; operation is already a FeatureOperations value"""
+        sketch = args["sketch"]
+        profile_index = args["profile_index"]
+        distance = args["distance"]
+        operation = args["operation"]
+        direction = args["direction"]
+        return_bodies = args["returnCreatedBodies"]
         root_comp = self.context.root_component
         
         # Find the sketch by name
-        target_sketch = self.resolver.resolve_sketch(args["sketch"])
+        target_sketch = self.resolver.resolve_sketch(sketch)
         
         # Get all profiles from the sketch
         profiles = target_sketch.profiles
         if profiles.count == 0:
-            raise ValidationError(f"Sketch '{args['sketch']}' has no profiles to extrude")
+            raise ValidationError(f"Sketch '{sketch}' has no profiles to extrude")
         
         # Validate profile index exists
-        if args["profile_index"] >= profiles.count:
-            raise ValidationError(f"Profile index {args['profile_index']} not found. Sketch has {profiles.count} profiles (0-{profiles.count-1})")
+        if profile_index >= profiles.count:
+            raise ValidationError(f"Profile index {profile_index} not found. Sketch has {profiles.count} profiles (0-{profiles.count-1})")
         
         # Get the specific profile
-        profile = profiles.item(args["profile_index"])
+        profile = profiles.item(profile_index)
         
         # Create extrude input
         extrudes = root_comp.features.extrudeFeatures
-        extrude_input = extrudes.createInput(profile, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-        
-        # Map operation string to Fusion operation
-        operation_mapping = {
-            "new_body": adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
-            "join": adsk.fusion.FeatureOperations.JoinFeatureOperation,
-            "cut": adsk.fusion.FeatureOperations.CutFeatureOperation,
-            "intersect": adsk.fusion.FeatureOperations.IntersectFeatureOperation
-        }
-        extrude_input.operation = operation_mapping[args["operation"]]
+        extrude_input = extrudes.createInput(profile, operation)
         
         # Set distance with direction
-        distance_input = adsk.core.ValueInput.createByReal(args["distance"])
+        distance_input = adsk.core.ValueInput.createByReal(distance)
         
-        if args["direction"] == "positive":
+        if direction is _POSITIVE:
             extrude_input.setOneSideExtent(adsk.fusion.DistanceExtentDefinition.create(distance_input), adsk.fusion.ExtentDirections.PositiveExtentDirection)
-        elif args["direction"] == "negative":
+        elif direction is _NEGATIVE:
             extrude_input.setOneSideExtent(adsk.fusion.DistanceExtentDefinition.create(distance_input), adsk.fusion.ExtentDirections.NegativeExtentDirection)
-        elif args["direction"] == "symmetric":
+        elif direction is _SYMMETRIC:
             # For symmetric, use full distance (Fusion splits equally)
             extrude_input.setSymmetricExtent(distance_input, True)
         
         # Create the extrusion
         extrude_feature = extrudes.add(extrude_input)
         
-        # Get created bodies from the feature
+        # Only enumerate the created bodies when the client asked for them; the
+        # cache walks the collection itself, and only if it holds a body index
+        feature_bodies = extrude_feature.bodies
+        if return_bodies:
+            feature_bodies = list(feature_bodies) if feature_bodies else []
+        
+        # Keep the resolver's body index current without a full rebuild
+        self.context.resolver_cache.add_bodies(root_comp, feature_bodies)
+        
+        # Get created bodies from the feature, in legacy and bodyRef form together
         created_bodies = []
-        if extrude_feature.bodies:
-            for i in range(extrude_feature.bodies.count):
-                body = extrude_feature.bodies.item(i)
+        created_refs = []
+        if return_bodies and feature_bodies:
+            component_name = root_comp.name
+            for body in feature_bodies:
+                body_name = body.name
                 created_bodies.append({
-                    "name": body.name if hasattr(body, 'name') else None,
+                    "name": body_name,
+                    # bodyType is not on every BRepBody binding, so this one stays guarded
                     "type": body.bodyType.name if hasattr(body, 'bodyType') else None
                 })
+                created_refs.append({
+                    "component": component_name,
+                    "body": body_name
+                })
         
-        # Return feature and body information
-        result = {
-            "feature": {
-                "type": "extrude",
-                "name": extrude_feature.name if hasattr(extrude_feature, 'name') else None
-            }
-        }
-        
-        # Add body info if any bodies were created (legacy shape)
-        if created_bodies:
-            result["bodies"] = created_bodies
-        
-        # Also provide createdBodies in bodyRef form per API_BRIDGE.md
-        try:
-            if created_bodies:
-                created_refs = []
-                for body in extrude_feature.bodies:
-                    created_refs.append({
-                        "component": root_comp.name,
-                        "body": body.name if hasattr(body, 'name') else None
-                    })
-                result["createdBodies"] = created_refs
-        except Exception:
-            pass
-        
-        return result
+        # Return feature and body information: the legacy bodies list plus
+        # createdBodies in bodyRef form per API_BRIDGE.md, when any were created
+        return _feature_result("extrude", extrude_feature.name, created_bodies, created_refs)
 
 
 class CombineBodiesHandler(BaseHandler):
     """Handler for combine_bodies action"""
     
+    # createInput argument shapes seen across API bindings, in probe order
+    _SIGNATURES = ("targetsOC_toolsBody", "targetBody_toolsOC", "targetsOC_toolsOC")
+    # First signature that worked in this process; tried first on every later call
+    _winning_sig = None
+    
     def validate(self, args: dict) -> dict:
         """Validate combine bodies arguments"""
         self.validators.validate_required_fields(args, ["targets", "tools"])
@@ -157,16 +227,20 @@ class CombineBodiesHandler(BaseHandler):
         return {
             "targets": targets,
             "tools": tools,
-            "operation": operation
+            # Resolve the FeatureOperations value once here (new_body was rejected above)
+            "operation": _op_map()[operation]
         }
     
     def execute(self, args: dict) -> dict:
-        """Execute combine bodies action"""
+        """Combine the target body with the tool body; operation is a FeatureOperations value"""
+        targets = args["targets"]
+        tools = args["tools"]
+        operation = args["operation"]
         root_comp = self.context.root_component
         
         # Resolve target and tool bodies
-        target_body = self.resolver.resolve_body_ref(args["targets"][0])
-        tool_body = self.resolver.resolve_body_ref(args["tools"][0])
+        target_body = self.resolver.resolve_body_ref(targets[0])
+        tool_body = self.resolver.resolve_body_ref(tools[0])
         
         # Create object collections
         target_collection = adsk.core.ObjectCollection.create()
@@ -177,17 +251,15 @@ class CombineBodiesHandler(BaseHandler):
         # Get combine features
         combine_feats = root_comp.features.combineFeatures
         
-        # Map operation string to Fusion operation
-        input_op = {
-            "join": adsk.fusion.FeatureOperations.JoinFeatureOperation,
-            "cut": adsk.fusion.FeatureOperations.CutFeatureOperation,
-            "intersect": adsk.fusion.FeatureOperations.IntersectFeatureOperation,
-        }[args["operation"]]
-        
-        # Some API bindings differ; try common permutations like monolithic implementation
+        # Some API bindings differ; try common permutations like monolithic implementation,
+        # starting with the one that last succeeded so the probe only reruns if it fails
         combine_input = None
         last_err = None
-        for sig in ("targetsOC_toolsBody", "targetBody_toolsOC", "targetsOC_toolsOC"):
+        cls = type(self)
+        signatures = self._SIGNATURES
+        if cls._winning_sig is not None:
+            signatures = (cls._winning_sig,) + tuple(s for s in signatures if s != cls._winning_sig)
+        for sig in signatures:
             try:
                 if sig == "targetsOC_toolsBody":
                     combine_input = combine_feats.createInput(target_collection, tool_body)
@@ -195,43 +267,51 @@ class CombineBodiesHandler(BaseHandler):
                     combine_input = combine_feats.createInput(target_body, tool_collection)
                 else:
                     combine_input = combine_feats.createInput(target_collection, tool_collection)
-                print(f"[COMBINE] Success with signature: {sig}")
+                if sig != cls._winning_sig:
+                    logger.info("Combine createInput signature: %s", sig)
+                    cls._winning_sig = sig
                 break
             except Exception as e:
-                print(f"[COMBINE] Failed signature {sig}: {str(e)}")
+                logger.debug("Combine signature %s failed: %s", sig, e)
                 last_err = e
                 continue
         
         if combine_input is None:
             raise FusionAPIError(str(last_err) if last_err else "Failed to create combine input")
         
-        combine_input.operation = input_op
+        combine_input.operation = operation
         # Keep tools: false for destructive by default; users can duplicate bodies if needed
         combine_input.isKeepToolBodies = False
         
         # Execute the combine operation
         combine_feats.add(combine_input)
         
-        return {"success": True}
+        return _SUCCESS
 
 
+@schema_validated
 class RevolveProfileHandler(BaseHandler):
     """Handler for revolve_profile action"""
     
+    SCHEMA = {
+        "sketch": "non_empty_string",
+        "profile_index": "non_negative_int",
+        "axisRef": "raw",
+        "angle": "positive_number",
+        "operation": ("operation", "new_body"),
+        "returnCreatedBodies": ("bool", False)
+    }
+    
     def validate(self, args: dict) -> dict:
         """Validate revolve profile arguments"""
-        self.validators.validate_required_fields(args, ["sketch", "profile_index", "axisRef", "angle"])
-        
-        sketch_name = self.validators.validate_non_empty_string(args["sketch"], "sketch")
-        profile_index = self.validators.validate_non_negative_int(args["profile_index"], "profile_index")
-        axis_ref = args["axisRef"]
-        angle = self.validators.validate_positive_number(args["angle"], "angle")
-        operation = args.get("operation", "new_body")
-        
-        # Validate operation
-        self.validators.validate_operation(operation)
-        
-        # Validate axisRef
+        validated = self._validate_fast(args)
+        validated["axis"] = self._axis_name(validated["axisRef"])
+        validated["operation"] = _op_map()[validated["operation"]]
+        return validated
+    
+    @staticmethod
+    def _axis_name(axis_ref) -> str:
+        """Validate axisRef and return its interned, upper-cased origin axis name"""
         if not isinstance(axis_ref, dict):
             raise ValidationError("axisRef must be an object")
         
@@ -243,41 +323,35 @@ class RevolveProfileHandler(BaseHandler):
         if axis_name not in ("X", "Y", "Z"):
             raise ValidationError("axisRef.axis must be one of: X, Y, Z")
         
-        return {
-            "sketch": sketch_name,
-            "profile_index": profile_index,
-            "axisRef": axis_ref,
-            "angle": angle,
-            "operation": operation
-        }
+        return sys.intern(axis_name)
     
     def execute(self, args: dict) -> dict:
-        """Execute revolve profile action"""
+        """Revolve profile_index of sketch about an origin axis; operation is a FeatureOperations value"""
+        sketch = args["sketch"]
+        profile_index = args["profile_index"]
+        axis_name = args["axis"]
+        angle = args["angle"]
+        operation = args["operation"]
+        return_bodies = args["returnCreatedBodies"]
         root_comp = self.context.root_component
         
         # Find sketch
-        target_sketch = self.resolver.resolve_sketch(args["sketch"])
+        target_sketch = self.resolver.resolve_sketch(sketch)
         
         # Get profile
         profiles = target_sketch.profiles
         if profiles.count == 0:
-            raise ValidationError(f"Sketch '{args['sketch']}' has no profiles to revolve")
-        if args["profile_index"] >= profiles.count:
-            raise ValidationError(f"Profile index {args['profile_index']} not found. Sketch has {profiles.count} profiles (0-{profiles.count-1})")
+            raise ValidationError(f"Sketch '{sketch}' has no profiles to revolve")
+        if profile_index >= profiles.count:
+            raise ValidationError(f"Profile index {profile_index} not found. Sketch has {profiles.count} profiles (0-{profiles.count-1})")
         
-        profile = profiles.item(args["profile_index"])
+        profile = profiles.item(profile_index)
         
         # Resolve axis - v0 supports origin axis X/Y/Z in root component
-        axis_name = str(args["axisRef"].get("axis", "")).upper()
         axis_obj = None
         try:
             # Use the root component's origin construction axes
-            if axis_name == "X":
-                axis_obj = root_comp.xConstructionAxis
-            elif axis_name == "Y":
-                axis_obj = root_comp.yConstructionAxis
-            else:
-                axis_obj = root_comp.zConstructionAxis
+            axis_obj = getattr(root_comp, _CONSTRUCTION_AXES[axis_name])
         except Exception as e:
             raise FusionAPIError(f"Failed to access origin axis {axis_name}: {str(e)}")
         
@@ -286,16 +360,10 @@ class RevolveProfileHandler(BaseHandler):
         
         # Build revolve input
         rev_feats = root_comp.features.revolveFeatures
-        op_map = {
-            "new_body": adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
-            "join": adsk.fusion.FeatureOperations.JoinFeatureOperation,
-            "cut": adsk.fusion.FeatureOperations.CutFeatureOperation,
-            "intersect": adsk.fusion.FeatureOperations.IntersectFeatureOperation,
-        }
         
-        angle_input = adsk.core.ValueInput.createByString(f"{args['angle']} deg")
+        angle_input = adsk.core.ValueInput.createByString(f"{angle} deg")
         # Use 3-arg createInput(profile, axis, operation) then specify angle extent
-        rev_input = rev_feats.createInput(profile, axis_obj, op_map[args["operation"]])
+        rev_input = rev_feats.createInput(profile, axis_obj, operation)
         try:
             rev_input.setAngleExtent(False, angle_input)
         except Exception as e:
@@ -311,29 +379,29 @@ class RevolveProfileHandler(BaseHandler):
             else:
                 raise FusionAPIError(f"Failed to revolve profile: {str(e)}")
         
-        # Prepare result - match monolithic format exactly
-        result = {
-            "feature": {
-                "type": "revolve",
-                "name": getattr(rev_feature, 'name', None)
-            }
-        }
-        
-        # Add createdBodies in bodyRef form per API_BRIDGE.md
+        # Read the created bodies once for the cache and the result, and only
+        # enumerate them when the client asked for createdBodies
         try:
-            if rev_feature.bodies and rev_feature.bodies.count > 0:
-                created_refs = []
-                for i in range(rev_feature.bodies.count):
-                    b = rev_feature.bodies.item(i)
-                    created_refs.append({
-                        "component": root_comp.name,
-                        "body": getattr(b, 'name', None)
-                    })
-                result["createdBodies"] = created_refs
+            feature_bodies = rev_feature.bodies
+            if return_bodies:
+                feature_bodies = list(feature_bodies) if feature_bodies else []
         except Exception:
-            pass
+            feature_bodies = []
+        
+        # Keep the resolver's body index current without a full rebuild
+        self.context.resolver_cache.add_bodies(root_comp, feature_bodies)
+        
+        # Add createdBodies in bodyRef form per API_BRIDGE.md
+        created_refs = None
+        if return_bodies and feature_bodies:
+            component_name = root_comp.name
+            created_refs = [
+                {"component": component_name, "body": b.name}
+                for b in feature_bodies
+            ]
 
-        return result
+        # Prepare result - match monolithic format exactly
+        return _feature_result("revolve", rev_feature.name, created_refs=created_refs)
 
 
 class RotateBodyHandler(BaseHandler):
@@ -349,12 +417,41 @@ class RotateBodyHandler(BaseHandler):
         copy = args.get("copy", False)
 
         # Validate bodyRef
+        self._validate_body_ref(body_ref, "bodyRef")
+
+        # Validate pivot
+        pivot = self._validate_pivot(pivot)
+
+        # Validate angle (can be positive or negative)
+        if not isinstance(angle, (int, float)):
+            raise ValidationError("angle must be a number")
+
+        # Validate copy
+        if not isinstance(copy, bool):
+            raise ValidationError("copy must be a boolean")
+
+        return {
+            "bodyRef": body_ref,
+            "pivot": pivot,
+            "angle": angle,
+            "copy": copy
+        }
+
+    @staticmethod
+    def _validate_body_ref(body_ref, field: str) -> None:
+        """Validate a bodyRef object"""
         if not isinstance(body_ref, dict):
-            raise ValidationError("bodyRef must be an object")
+            raise ValidationError(f"{field} must be an object")
         if "component" not in body_ref or "body" not in body_ref:
-            raise ValidationError("bodyRef must contain 'component' and 'body' fields")
+            raise ValidationError(f"{field} must contain 'component' and 'body' fields")
 
-        # Validate pivot
+    @staticmethod
+    def _validate_pivot(pivot) -> dict:
+        """Validate a pivot object (origin_axis or edge_axis)
+
+        Returns a copy with type interned and, for origin_axis, axis upper-cased
+        and interned, so the transform builder needs no further normalisation.
+        """
         if not isinstance(pivot, dict):
             raise ValidationError("pivot must be an object")
 
@@ -373,75 +470,75 @@ class RotateBodyHandler(BaseHandler):
             if "component" not in edge_ref or "body" not in edge_ref or "edgeIndex" not in edge_ref:
                 raise ValidationError("edgeRef must contain 'component', 'body', and 'edgeIndex' fields")
 
-        # Validate angle (can be positive or negative)
-        if not isinstance(angle, (int, float)):
-            raise ValidationError("angle must be a number")
-
-        # Validate copy
-        if not isinstance(copy, bool):
-            raise ValidationError("copy must be a boolean")
+        normalized = dict(pivot, type=sys.intern(pivot_type))
+        if pivot_type == "origin_axis":
+            normalized["axis"] = sys.intern(axis)
+        return normalized
+
+    @staticmethod
+    def _edge_axis_key(edge_ref: dict):
+        """ResolverCache key for an edgeRef, or None if its values can't be a key"""
+        component, body, index = edge_ref["component"], edge_ref["body"], edge_ref["edgeIndex"]
+        if type(component) is str and type(body) is str and type(index) is int:
+            return component, body, index
+        return None
+
+    def _edge_axis(self, edge_ref: dict, root_comp):
+        """(unit axis Vector3D, origin Point3D) of a linear edge, cached per root revision"""
+        cache = self.context.resolver_cache
+        key = self._edge_axis_key(edge_ref)
+        if key is not None:
+            cached = cache.get_edge_axis(root_comp, key)
+            if cached is not None:
+                return cached
+
+        edge = self.resolver.resolve_edge_ref(edge_ref)
+
+        # Get the edge geometry to determine axis and point
+        geom = edge.geometry
+        if hasattr(geom, 'startPoint') and hasattr(geom, 'endPoint'):
+            # Line edge - use direction as axis
+            start_pt = geom.startPoint
+            end_pt = geom.endPoint
+            axis_vector = adsk.core.Vector3D.create(
+                end_pt.x - start_pt.x,
+                end_pt.y - start_pt.y,
+                end_pt.z - start_pt.z
+            )
+            axis_vector.normalize()
+        else:
+            raise ValidationError("Edge pivot currently only supports linear edges")
 
-        return {
-            "bodyRef": body_ref,
-            "pivot": pivot,
-            "angle": angle,
-            "copy": copy
-        }
+        axis = (axis_vector, start_pt)
+        if key is not None:
+            cache.put_edge_axis(key, axis)
+        return axis
 
-    def execute(self, args: dict) -> dict:
-        """Execute rotate body action"""
-        import math
+    def _rotation_transform(self, pivot: dict, angle_deg, root_comp):
+        """Matrix3D rotating angle_deg degrees about the validated pivot"""
+        if pivot["type"] is _ORIGIN_AXIS:
+            return _origin_rotation(pivot["axis"], angle_deg)
 
-        root_comp = self.context.root_component
+        # Resolve the edge for pivot (or reuse its axis from an earlier call)
+        axis_vector, origin = self._edge_axis(pivot["edgeRef"], root_comp)
 
-        # Resolve the body
-        body = self.resolver.resolve_body_ref(args["bodyRef"])
+        transform = adsk.core.Matrix3D.create()
+        transform.setToRotation(_radians(angle_deg), axis_vector, origin)
+        return transform
 
-        # Get pivot information
+    def execute(self, args: dict) -> dict:
+        """Rotate (or copy and rotate) one body"""
+        body_ref = args["bodyRef"]
         pivot = args["pivot"]
-        pivot_type = pivot["type"]
-        angle_deg = args["angle"]
-        angle_rad = math.radians(angle_deg)
+        angle = args["angle"]
         copy_mode = args["copy"]
+        root_comp = self.context.root_component
 
-        # Create the rotation transform
-        transform = adsk.core.Matrix3D.create()
-
-        if pivot_type == "origin_axis":
-            axis = pivot["axis"].upper()
-            origin = adsk.core.Point3D.create(0, 0, 0)
-
-            if axis == "X":
-                axis_vector = adsk.core.Vector3D.create(1, 0, 0)
-            elif axis == "Y":
-                axis_vector = adsk.core.Vector3D.create(0, 1, 0)
-            else:  # Z
-                axis_vector = adsk.core.Vector3D.create(0, 0, 1)
-
-            transform.setToRotation(angle_rad, axis_vector, origin)
-
-        elif pivot_type == "edge_axis":
-            # Resolve the edge for pivot
-            edge_ref = pivot["edgeRef"]
-            edge = self.resolver.resolve_edge_ref(edge_ref)
-
-            # Get the edge geometry to determine axis and point
-            geom = edge.geometry
-            if hasattr(geom, 'startPoint') and hasattr(geom, 'endPoint'):
-                # Line edge - use direction as axis
-                start_pt = geom.startPoint
-                end_pt = geom.endPoint
-                axis_vector = adsk.core.Vector3D.create(
-                    end_pt.x - start_pt.x,
-                    end_pt.y - start_pt.y,
-                    end_pt.z - start_pt.z
-                )
-                axis_vector.normalize()
-                origin = start_pt
-            else:
-                raise ValidationError("Edge pivot currently only supports linear edges")
+        # Resolve the body
+        body = self.resolver.resolve_body_ref(body_ref)
 
-            transform.setToRotation(angle_rad, axis_vector, origin)
+        # Get pivot information
+        transform = self._rotation_transform(pivot, angle, root_comp)
 
         # Create object collection for the body
         body_collection = adsk.core.ObjectCollection.create()
@@ -461,6 +558,7 @@ class RotateBodyHandler(BaseHandler):
                     new_body_collection.add(new_body)
                     move_input = move_feats.createInput(new_body_collection, transform)
                     move_feats.add(move_input)
+                    self.context.resolver_cache.add_bodies(root_comp, (new_body,), existing_unchanged=True)
 
                     return {
                         "success": True,
@@ -479,6 +577,7 @@ class RotateBodyHandler(BaseHandler):
             try:
                 move_input = move_feats.createInput(body_collection, transform)
                 move_feats.add(move_input)
+                self.context.resolver_cache.moved_bodies(root_comp, (body_ref["body"],))
 
                 return {
                     "success": True,
@@ -489,3 +588,101 @@ class RotateBodyHandler(BaseHandler):
                 }
             except Exception as e:
                 raise FusionAPIError(f"Failed to rotate body: {str(e)}")
+
+
+class RotateBodiesBatchHandler(RotateBodyHandler):
+    """Handler for rotate_bodies action - one transform, one move feature for N bodies"""
+
+    def validate(self, args: dict) -> dict:
+        """Validate rotate bodies arguments"""
+        self.validators.validate_required_fields(args, ["bodies", "pivot", "angle"])
+
+        bodies = args["bodies"]
+        pivot = args["pivot"]
+        angle = args["angle"]
+        copy = args.get("copy", False)
+
+        # Validate bodies
+        if not isinstance(bodies, list) or not bodies:
+            raise ValidationError("bodies must be a non-empty array of bodyRef")
+        seen = set()
+        for i, body_ref in enumerate(bodies):
+            self._validate_body_ref(body_ref, f"bodies[{i}]")
+            key = (body_ref["component"], body_ref["body"])
+            if key in seen:
+                raise ValidationError(f"bodies[{i}] repeats body '{body_ref['body']}'")
+            seen.add(key)
+
+        # Validate pivot
+        pivot = self._validate_pivot(pivot)
+
+        # Validate angle (can be positive or negative)
+        if not isinstance(angle, (int, float)):
+            raise ValidationError("angle must be a number")
+
+        # Validate copy
+        if not isinstance(copy, bool):
+            raise ValidationError("copy must be a boolean")
+
+        return {
+            "bodies": bodies,
+            "pivot": pivot,
+            "angle": angle,
+            "copy": copy
+        }
+
+    def execute(self, args: dict) -> dict:
+        """Rotate (or copy and rotate) every body with one transform"""
+        body_refs = args["bodies"]
+        pivot = args["pivot"]
+        angle = args["angle"]
+        copy_mode = args["copy"]
+        root_comp = self.context.root_component
+
+        # Resolve every body before touching the design so a bad ref changes nothing
+        bodies = [self.resolver.resolve_body_ref(ref) for ref in body_refs]
+
+        # One transform and one collection for the whole set
+        transform = self._rotation_transform(pivot, angle, root_comp)
+        body_collection = adsk.core.ObjectCollection.create()
+        for body in bodies:
+            body_collection.add(body)
+
+        features = root_comp.features
+        component_name = root_comp.name
+
+        if copy_mode:
+            try:
+                new_bodies = features.copyPasteBodies.add(body_collection)
+                if new_bodies.count == 0:
+                    raise FusionAPIError("Copy operation did not create any bodies")
+                new_bodies = list(new_bodies)
+                new_body_collection = adsk.core.ObjectCollection.create()
+                for new_body in new_bodies:
+                    new_body_collection.add(new_body)
+                move_feats = features.moveFeatures
+                move_feats.add(move_feats.createInput(new_body_collection, transform))
+                self.context.resolver_cache.add_bodies(root_comp, new_bodies, existing_unchanged=True)
+            except Exception as e:
+                raise FusionAPIError(f"Failed to copy and rotate bodies: {str(e)}")
+
+            return {
+                "success": True,
+                "createdBodies": [
+                    {"component": component_name, "body": b.name} for b in new_bodies
+                ]
+            }
+
+        try:
+            move_feats = features.moveFeatures
+            move_feats.add(move_feats.createInput(body_collection, transform))
+            self.context.resolver_cache.moved_bodies(root_comp, [ref["body"] for ref in body_refs])
+        except Exception as e:
+            raise FusionAPIError(f"Failed to rotate bodies: {str(e)}")
+
+        return {
+            "success": True,
+            "transformedBodies": [
+                {"component": component_name, "body": b.name} for b in bodies
+            ]
+        }
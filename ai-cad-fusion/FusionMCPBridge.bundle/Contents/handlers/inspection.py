@@ -1,6 +1,7 @@
 """
 Inspection and measurement-related handlers
 """
+import math
 import adsk.core
 import adsk.fusion
 from handlers.base import BaseHandler
@@ -25,7 +26,14 @@ class MeasureGeometryHandler(BaseHandler):
     def execute(self, args: dict) -> dict:
         """Execute measure geometry action"""
         root_comp = self.context.root_component
+        root_name = root_comp.name
+        cache = self.context.resolver_cache
+        # One name -> body dict for every ref; the first miss or stale hit rescans once
+        bodies = None
+        rebuilt = False
         measurements = []
+        # (measurement, body name, body) for every ref that resolved to a body
+        targets = []
         
         for ref in args["refs"]:
             if not isinstance(ref, dict):
@@ -39,18 +47,39 @@ class MeasureGeometryHandler(BaseHandler):
                 component_name = ref["component"]
                 
                 # Find the body (simplified - assume root component for v0)
-                if component_name == root_comp.name:
+                if component_name == root_name:
                     try:
-                        for body in root_comp.bRepBodies:
-                            if body.name == body_name:
-                                if hasattr(body, 'physicalProperties'):
-                                    measurement["volume"] = body.physicalProperties.volume
-                                break
+                        if bodies is None:
+                            bodies = cache.body_index(root_comp)
+                        body = bodies.get(body_name)
+                        if (body is None or not body.isValid) and not rebuilt:
+                            bodies = cache.body_index(root_comp, rebuild=True)
+                            rebuilt = True
+                            body = bodies.get(body_name)
+                        if body is not None:
+                            targets.append((measurement, body_name, body))
                     except:
                         pass
             
             measurements.append(measurement)
         
-        return {
+        # Read physical properties in one pass once every ref is resolved, once per
+        # distinct body even if several refs name it
+        volumes = {}
+        for measurement, body_name, body in targets:
+            if body_name not in volumes:
+                try:
+                    volumes[body_name] = body.physicalProperties.volume
+                except:
+                    volumes[body_name] = None
+            if volumes[body_name] is not None:
+                measurement["volume"] = volumes[body_name]
+        
+        result = {
             "measurements": measurements
-        }
\ No newline at end of file
+        }
+        measured = [v for v in volumes.values() if v is not None]
+        if measured:
+            # Sum over distinct bodies, so a body listed twice is counted once
+            result["totalVolume"] = math.fsum(measured)
+        return result
@@ -5,37 +5,31 @@ import adsk.core
 import adsk.fusion
 from handlers.base import BaseHandler
 from core.errors import ValidationError, FusionAPIError
+from services.validators import schema_validated
 
 
+@schema_validated
 class CreateParameterHandler(BaseHandler):
     """Handler for create_parameter action"""
     
+    SCHEMA = {
+        "name": "non_empty_string",
+        "expression": "str",
+        "unit": "unit",
+        "comment": ("optional_string", "")
+    }
+    
     def validate(self, args: dict) -> dict:
         """Validate parameter creation arguments"""
-        # Use centralized validation service
-        self.validators.validate_required_fields(args, ["name", "expression", "unit"])
-        
-        name = self.validators.validate_non_empty_string(args["name"], "name")
-        expression = str(args["expression"])
-        unit = args["unit"]
-        comment = args.get("comment", "")
-        
-        # Validate unit against allowlist
-        self.validators.validate_unit(unit)
-        
-        # Validate comment type
-        if comment is not None and not isinstance(comment, str):
-            raise ValidationError("comment must be a string when provided")
+        validated = self._validate_fast(args)
+        validated["comment"] = validated["comment"] or ""
         
         # Check for name collision (determinism requirement)
-        self.validators.check_parameter_name_collision(name, self.context.design)
+        self.validators.check_parameter_name_collision(
+            validated["name"], self.context.design, self.context.resolver_cache
+        )
         
-        return {
-            "name": name,
-            "expression": expression,
-            "unit": unit,
-            "comment": comment or ""
-        }
+        return validated
     
     def execute(self, args: dict) -> dict:
         """Create the parameter"""
@@ -46,6 +40,7 @@ class CreateParameterHandler(BaseHandler):
             args["unit"],
             args["comment"]
         )
+        self.context.resolver_cache.add_parameter(param)
         
         result = {
             "name": param.name,
@@ -59,54 +54,33 @@ class CreateParameterHandler(BaseHandler):
         return result
 
 
+@schema_validated
 class UpdateParameterHandler(BaseHandler):
     """Handler for update_parameter action"""
     
+    SCHEMA = {
+        "name": "non_empty_string",
+        "expression": ("optional_str", None),
+        "unit": ("optional_unit", None),
+        "comment": ("optional_string", None)
+    }
+    
     def validate(self, args: dict) -> dict:
         """Validate parameter update arguments"""
-        self.validators.validate_required_fields(args, ["name"])
-        
-        name = self.validators.validate_non_empty_string(args["name"], "name")
-        expression = args.get("expression")
-        unit = args.get("unit")
-        comment = args.get("comment")
-        
-        # Convert expression to string if provided
-        if expression is not None:
-            expression = str(expression)
-        
-        # Validate unit if provided
-        if unit is not None:
-            if not isinstance(unit, str):
-                raise ValidationError("unit must be a string when provided")
-            self.validators.validate_unit(unit)
-        
-        # Validate comment if provided
-        if comment is not None and not isinstance(comment, str):
-            raise ValidationError("comment must be a string when provided")
+        validated = self._validate_fast(args)
         
         # Ensure at least one field to update
-        if expression is None and unit is None and comment is None:
+        if validated["expression"] is None and validated["unit"] is None and validated["comment"] is None:
             raise ValidationError("At least one of expression, unit, or comment must be provided")
         
-        return {
-            "name": name,
-            "expression": expression,
-            "unit": unit,
-            "comment": comment
-        }
+        return validated
     
     def execute(self, args: dict) -> dict:
         """Update the parameter"""
         design = self.context.design
         
         # Find the parameter
-        target_param = None
-        if design.userParameters:
-            for p in design.userParameters:
-                if p.name == args["name"]:
-                    target_param = p
-                    break
+        target_param = self.context.resolver_cache.get_parameter(design, args["name"])
         if target_param is None:
             raise ValidationError(f"Parameter '{args['name']}' not found")
         
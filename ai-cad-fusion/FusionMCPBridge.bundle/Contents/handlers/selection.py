@@ -5,6 +5,64 @@ import adsk.core
 import adsk.fusion
 from handlers.base import BaseHandler
 from core.errors import FusionAPIError, ValidationError
+from services.validators import is_index
+
+
+# What the Fusion API raises for a failed or unsupported property read (RuntimeError)
+# or a property this entity's class lacks (AttributeError); anything else is a bug
+# and surfaces as an "error" entity from _describe_entity
+_API_ERRORS = (RuntimeError, AttributeError)
+
+# Bound once at import; casts run for every described selection
+_cast_face = adsk.fusion.BRepFace.cast
+_cast_edge = adsk.fusion.BRepEdge.cast
+_cast_vertex = adsk.fusion.BRepVertex.cast
+_cast_body = adsk.fusion.BRepBody.cast
+_cast_component = adsk.fusion.Component.cast
+_cast_occurrence = adsk.fusion.Occurrence.cast
+_cast_sketch_line = adsk.fusion.SketchLine.cast
+_cast_sketch_circle = adsk.fusion.SketchCircle.cast
+_cast_sketch_arc = adsk.fusion.SketchArc.cast
+_cast_sketch_point = adsk.fusion.SketchPoint.cast
+_cast_sketch = adsk.fusion.Sketch.cast
+_cast_plane = adsk.fusion.ConstructionPlane.cast
+
+
+def _point_dict(point) -> dict:
+    """Point3D as an {x, y, z} dict"""
+    return {
+        "x": point.x,
+        "y": point.y,
+        "z": point.z
+    }
+
+
+# Geometry class name -> reported surfaceType/curveType; names not listed fall back to
+# the string transform these tables were generated from
+_SURFACE_TYPES = {
+    name: name.replace("Surface", "").lower()
+    for name in ("Plane", "Cylinder", "Cone", "Sphere", "Torus",
+                 "EllipticalCylinder", "EllipticalCone", "NurbsSurface")
+}
+_CURVE_TYPES = {
+    name: name.replace("Curve3D", "").replace("3D", "").lower()
+    for name in ("Line3D", "Arc3D", "Circle3D", "Ellipse3D", "EllipticalArc3D",
+                 "InfiniteLine3D", "NurbsCurve3D")
+}
+
+
+# (API class name, cast, result type, collection path from the parent sketch,
+#  reports isConstruction, ((result key, attribute, converter or None), ...))
+_SKETCH_SPECS = (
+    ("SketchLine", _cast_sketch_line, "sketchLine", ("sketchCurves", "sketchLines"),
+     True, (("length_cm", "length", None),)),
+    ("SketchCircle", _cast_sketch_circle, "sketchCircle", ("sketchCurves", "sketchCircles"),
+     True, (("radius_cm", "radius", None),)),
+    ("SketchArc", _cast_sketch_arc, "sketchArc", ("sketchCurves", "sketchArcs"),
+     True, (("radius_cm", "radius", None),)),
+    ("SketchPoint", _cast_sketch_point, "sketchPoint", ("sketchPoints",),
+     False, (("position", "geometry", _point_dict),)),
+)
 
 
 class GetSelectionHandler(BaseHandler):
@@ -12,34 +70,84 @@ class GetSelectionHandler(BaseHandler):
 
     MAX_ENTITIES = 20  # Cap to avoid context explosion
 
+    # API class name -> (class, cast, describer method, extra describer args)
+    _DISPATCH = {
+        "BRepFace": (adsk.fusion.BRepFace, _cast_face, "_describe_face", ()),
+        "BRepEdge": (adsk.fusion.BRepEdge, _cast_edge, "_describe_edge", ()),
+        "BRepVertex": (adsk.fusion.BRepVertex, _cast_vertex, "_describe_vertex", ()),
+        "BRepBody": (adsk.fusion.BRepBody, _cast_body, "_describe_body", ()),
+        "Component": (adsk.fusion.Component, _cast_component, "_describe_component", ()),
+        "Occurrence": (adsk.fusion.Occurrence, _cast_occurrence, "_describe_occurrence", ()),
+        "Sketch": (adsk.fusion.Sketch, _cast_sketch, "_describe_sketch", ()),
+        "ConstructionPlane": (adsk.fusion.ConstructionPlane, _cast_plane, "_describe_construction_plane", ()),
+        **{spec[0]: (getattr(adsk.fusion, spec[0]), spec[1], "_describe_sketch_item", (spec,))
+           for spec in _SKETCH_SPECS},
+    }
+
+    # API class name -> the "type" reported for it, for the count and ids modes
+    _TYPE_TAGS = {
+        "BRepFace": "face",
+        "BRepEdge": "edge",
+        "BRepVertex": "vertex",
+        "BRepBody": "body",
+        "Component": "component",
+        "Occurrence": "occurrence",
+        "Sketch": "sketch",
+        "ConstructionPlane": "constructionPlane",
+        **{spec[0]: spec[2] for spec in _SKETCH_SPECS},
+    }
+
+    def __init__(self, context, resolver, validators):
+        super().__init__(context, resolver, validators)
+        # body entityToken -> (name, component name); reset by every execute()
+        self._body_meta = {}
+
     def validate(self, args: dict) -> dict:
-        """No arguments needed"""
-        return args
+        """Validate the optional mode and detail level"""
+        mode = args.get("mode", "full")
+        if mode not in ("full", "count", "ids"):
+            raise ValidationError("mode must be 'full', 'count' or 'ids'")
+
+        detail = args.get("detail", "full")
+        if detail not in ("minimal", "full"):
+            raise ValidationError("detail must be 'minimal' or 'full'")
+        return {"mode": mode, "detail": detail}
 
     def execute(self, args: dict) -> dict:
         """Get current selection state"""
         try:
+            # "minimal" reports only what is needed to reference each entity again,
+            # skipping geometry, measurement and mass-property reads
+            full = args.get("detail", "full") != "minimal"
+            self._body_meta = {}
+
             app = self.context.app
             ui = app.userInterface
 
-            if not ui or not ui.activeSelections:
+            mode = args.get("mode", "full")
+            selections = ui.activeSelections if ui else None
+            if not selections:
+                if mode == "count":
+                    return {"count": 0, "types": {}}
                 return {
                     "count": 0,
                     "entities": [],
                     "truncated": False
                 }
 
-            selections = ui.activeSelections
             total_count = selections.count
+            if mode == "count":
+                return self._count_types(selections, total_count)
 
-            entities = []
-            for i in range(min(total_count, self.MAX_ENTITIES)):
-                sel = selections.item(i)
-                entity = sel.entity
+            # Read each selection's entity once, up to the cap, before describing any
+            item = selections.item
+            selected = [item(i).entity for i in range(min(total_count, self.MAX_ENTITIES))]
 
-                entity_info = self._describe_entity(entity, i)
-                if entity_info:
-                    entities.append(entity_info)
+            if mode == "ids":
+                entities = [self._entity_id(entity, i) for i, entity in enumerate(selected)]
+            else:
+                describe = self._describe_entity
+                entities = [info for info in (describe(entity, i, full) for i, entity in enumerate(selected)) if info]
 
             return {
                 "count": total_count,
@@ -50,72 +158,95 @@ class GetSelectionHandler(BaseHandler):
         except Exception as e:
             raise FusionAPIError(f"Failed to get selection: {str(e)}")
 
-    def _describe_entity(self, entity, index: int) -> dict:
-        """Describe a selected entity with enough info to reference it later"""
+    def _count_types(self, selections, total_count: int) -> dict:
+        """count mode: selected entities per type, from class names alone (no describers, no cap)"""
+        tags = self._TYPE_TAGS
+        item = selections.item
+        types = {}
+        for i in range(total_count):
+            name = type(item(i).entity).__name__
+            tag = tags.get(name, name)
+            types[tag] = types.get(tag, 0) + 1
+        return {
+            "count": total_count,
+            "types": types
+        }
+
+    def _entity_id(self, entity, index: int) -> dict:
+        """ids mode: type and entityToken only"""
+        name = type(entity).__name__
+        result = {
+            "type": self._TYPE_TAGS.get(name, name),
+            "index": index
+        }
+        try:
+            result["entityToken"] = entity.entityToken
+        except _API_ERRORS:
+            pass
+        return result
+
+    def _describe_entity(self, entity, index: int, full: bool = True) -> dict:
+        """Describe a selected entity with enough info to reference it later
+
+        full adds geometry types, measurements and positions to each description.
+        """
         try:
+            # Selection entities arrive as their concrete API class, so one table
+            # lookup and an isinstance check usually replace probing every type in
+            # turn; cast() only runs if the proxy's Python class doesn't match
+            dispatch = self._DISPATCH.get(type(entity).__name__)
+            if dispatch:
+                cls, cast, describe, extra = dispatch
+                typed = entity if isinstance(entity, cls) else cast(entity)
+                if typed:
+                    return getattr(self, describe)(typed, index, full, *extra)
+
             # Try to cast to various types and extract relevant info
 
             # BRep Face
-            face = adsk.fusion.BRepFace.cast(entity)
+            face = _cast_face(entity)
             if face:
-                return self._describe_face(face, index)
+                return self._describe_face(face, index, full)
 
             # BRep Edge
-            edge = adsk.fusion.BRepEdge.cast(entity)
+            edge = _cast_edge(entity)
             if edge:
-                return self._describe_edge(edge, index)
+                return self._describe_edge(edge, index, full)
 
             # BRep Vertex
-            vertex = adsk.fusion.BRepVertex.cast(entity)
+            vertex = _cast_vertex(entity)
             if vertex:
-                return self._describe_vertex(vertex, index)
+                return self._describe_vertex(vertex, index, full)
 
             # BRep Body
-            body = adsk.fusion.BRepBody.cast(entity)
+            body = _cast_body(entity)
             if body:
-                return self._describe_body(body, index)
+                return self._describe_body(body, index, full)
 
             # Component
-            component = adsk.fusion.Component.cast(entity)
+            component = _cast_component(entity)
             if component:
-                return {
-                    "type": "component",
-                    "index": index,
-                    "name": component.name
-                }
+                return self._describe_component(component, index, full)
 
             # Occurrence
-            occurrence = adsk.fusion.Occurrence.cast(entity)
+            occurrence = _cast_occurrence(entity)
             if occurrence:
-                return {
-                    "type": "occurrence",
-                    "index": index,
-                    "name": occurrence.name,
-                    "componentName": occurrence.component.name if occurrence.component else None
-                }
+                return self._describe_occurrence(occurrence, index, full)
 
             # Sketch entities
-            sketch_entity = self._describe_sketch_entity(entity, index)
+            sketch_entity = self._describe_sketch_entity(entity, index, full)
             if sketch_entity:
                 return sketch_entity
 
             # Sketch itself
-            sketch = adsk.fusion.Sketch.cast(entity)
+            sketch = _cast_sketch(entity)
             if sketch:
-                return {
-                    "type": "sketch",
-                    "index": index,
-                    "name": sketch.name
-                }
+                return self._describe_sketch(sketch, index, full)
 
             # Construction plane
-            plane = adsk.fusion.ConstructionPlane.cast(entity)
+            plane = _cast_plane(entity)
             if plane:
-                return {
-                    "type": "constructionPlane",
-                    "index": index,
-                    "name": plane.name if hasattr(plane, 'name') else "ConstructionPlane"
-                }
+                return self._describe_construction_plane(plane, index, full)
 
             # Unknown type
             return {
@@ -131,7 +262,7 @@ class GetSelectionHandler(BaseHandler):
                 "error": str(e)
             }
 
-    def _describe_face(self, face: adsk.fusion.BRepFace, index: int) -> dict:
+    def _describe_face(self, face: adsk.fusion.BRepFace, index: int, full: bool = True) -> dict:
         """Describe a BRep face"""
         result = {
             "type": "face",
@@ -142,38 +273,38 @@ class GetSelectionHandler(BaseHandler):
         try:
             body = face.body
             if body:
-                result["bodyName"] = body.name
-
-                # Get component
-                comp = body.parentComponent
-                if comp:
-                    result["componentName"] = comp.name
+                body_name, component_name = self._body_meta_for(body)
+                result["bodyName"] = body_name
+                if component_name is not None:
+                    result["componentName"] = component_name
 
                 # Find face index within body
-                for i in range(body.faces.count):
-                    if body.faces.item(i) == face:
-                        result["faceIndex"] = i
-                        break
-        except:
+                index_in_body = self._index_of(body, ("faces",), face)
+                if index_in_body is not None:
+                    result["faceIndex"] = index_in_body
+        except _API_ERRORS:
             pass
 
+        if not full:
+            return result
+
         # Get surface type
         try:
-            geometry = face.geometry
-            surface_type = type(geometry).__name__
-            result["surfaceType"] = surface_type.replace("Surface", "").lower()
-        except:
+            surface_type = type(face.geometry).__name__
+            result["surfaceType"] = (_SURFACE_TYPES.get(surface_type)
+                                     or surface_type.replace("Surface", "").lower())
+        except _API_ERRORS:
             result["surfaceType"] = "unknown"
 
         # Get area
         try:
             result["area_cm2"] = face.area
-        except:
+        except _API_ERRORS:
             pass
 
         return result
 
-    def _describe_edge(self, edge: adsk.fusion.BRepEdge, index: int) -> dict:
+    def _describe_edge(self, edge: adsk.fusion.BRepEdge, index: int, full: bool = True) -> dict:
         """Describe a BRep edge"""
         result = {
             "type": "edge",
@@ -184,37 +315,38 @@ class GetSelectionHandler(BaseHandler):
         try:
             body = edge.body
             if body:
-                result["bodyName"] = body.name
-
-                comp = body.parentComponent
-                if comp:
-                    result["componentName"] = comp.name
+                body_name, component_name = self._body_meta_for(body)
+                result["bodyName"] = body_name
+                if component_name is not None:
+                    result["componentName"] = component_name
 
                 # Find edge index within body
-                for i in range(body.edges.count):
-                    if body.edges.item(i) == edge:
-                        result["edgeIndex"] = i
-                        break
-        except:
+                index_in_body = self._index_of(body, ("edges",), edge)
+                if index_in_body is not None:
+                    result["edgeIndex"] = index_in_body
+        except _API_ERRORS:
             pass
 
+        if not full:
+            return result
+
         # Get curve type
         try:
-            geometry = edge.geometry
-            curve_type = type(geometry).__name__
-            result["curveType"] = curve_type.replace("Curve3D", "").replace("3D", "").lower()
-        except:
+            curve_type = type(edge.geometry).__name__
+            result["curveType"] = (_CURVE_TYPES.get(curve_type)
+                                   or curve_type.replace("Curve3D", "").replace("3D", "").lower())
+        except _API_ERRORS:
             result["curveType"] = "unknown"
 
         # Get length
         try:
             result["length_cm"] = edge.length
-        except:
+        except _API_ERRORS:
             pass
 
         return result
 
-    def _describe_vertex(self, vertex: adsk.fusion.BRepVertex, index: int) -> dict:
+    def _describe_vertex(self, vertex: adsk.fusion.BRepVertex, index: int, full: bool = True) -> dict:
         """Describe a BRep vertex"""
         result = {
             "type": "vertex",
@@ -229,158 +361,205 @@ class GetSelectionHandler(BaseHandler):
                 edge = edges.item(0)
                 body = edge.body
                 if body:
-                    result["bodyName"] = body.name
-
-                    comp = body.parentComponent
-                    if comp:
-                        result["componentName"] = comp.name
-        except:
+                    body_name, component_name = self._body_meta_for(body)
+                    result["bodyName"] = body_name
+                    if component_name is not None:
+                        result["componentName"] = component_name
+        except _API_ERRORS:
             pass
 
+        if not full:
+            return result
+
         # Get position
         try:
-            point = vertex.geometry
-            result["position"] = {
-                "x": point.x,
-                "y": point.y,
-                "z": point.z
-            }
-        except:
+            result["position"] = _point_dict(vertex.geometry)
+        except _API_ERRORS:
             pass
 
         return result
 
-    def _describe_body(self, body: adsk.fusion.BRepBody, index: int) -> dict:
+    def _describe_body(self, body: adsk.fusion.BRepBody, index: int, full: bool = True) -> dict:
         """Describe a BRep body"""
+        body_name, component_name = self._body_meta_for(body)
         result = {
             "type": "body",
             "index": index,
-            "bodyName": body.name
+            "bodyName": body_name
         }
-
-        # Get component
-        try:
-            comp = body.parentComponent
-            if comp:
-                result["componentName"] = comp.name
-        except:
-            pass
+        if component_name is not None:
+            result["componentName"] = component_name
 
         # Get face/edge counts
         try:
             result["faceCount"] = body.faces.count
             result["edgeCount"] = body.edges.count
-        except:
+        except _API_ERRORS:
             pass
 
+        if not full:
+            return result
+
         # Get volume if available
         try:
-            props = body.physicalProperties
-            if props:
-                result["volume_cm3"] = props.volume
-        except:
+            volume = self._body_volume(body)
+            if volume is not None:
+                result["volume_cm3"] = volume
+        except _API_ERRORS:
             pass
 
         return result
 
-    def _describe_sketch_entity(self, entity, index: int) -> dict:
-        """Try to describe as sketch entity"""
+    def _body_meta_for(self, body: adsk.fusion.BRepBody) -> tuple:
+        """(body name, component name or None), read from Fusion once per body per request"""
+        key = body.entityToken
+        meta = self._body_meta.get(key)
+        if meta is None:
+            comp = body.parentComponent
+            meta = self._body_meta[key] = (body.name, comp.name if comp else None)
+        return meta
+
+    def _body_volume(self, body: adsk.fusion.BRepBody):
+        """Body volume, recomputed only when the body's revisionId changes
+
+        physicalProperties evaluates mass properties and is by far the slowest
+        read here, so the result is kept in the ResolverCache per body token and revision.
+        """
+        key = body.entityToken
+        revision = body.revisionId
+        resolver_cache = self.context.resolver_cache
+        cached = resolver_cache.get_volume(key)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        props = body.physicalProperties
+        volume = props.volume if props else None
+        resolver_cache.put_volume(key, (revision, volume))
+        return volume
+
+    def _describe_component(self, component: adsk.fusion.Component, index: int, full: bool = True) -> dict:
+        """Describe a component"""
+        return {
+            "type": "component",
+            "index": index,
+            "name": component.name
+        }
 
-        # Sketch line
-        line = adsk.fusion.SketchLine.cast(entity)
-        if line:
-            result = {
-                "type": "sketchLine",
-                "index": index,
-                "isConstruction": line.isConstruction
-            }
-            try:
-                result["sketchName"] = line.parentSketch.name
-                result["length_cm"] = line.length
-
-                # Find line index in sketch
-                lines = line.parentSketch.sketchCurves.sketchLines
-                for i in range(lines.count):
-                    if lines.item(i) == line:
-                        result["entityIndex"] = i
-                        break
-            except:
-                pass
-            return result
+    def _describe_occurrence(self, occurrence: adsk.fusion.Occurrence, index: int, full: bool = True) -> dict:
+        """Describe an occurrence"""
+        comp = occurrence.component
+        return {
+            "type": "occurrence",
+            "index": index,
+            "name": occurrence.name,
+            "componentName": comp.name if comp else None
+        }
 
-        # Sketch circle
-        circle = adsk.fusion.SketchCircle.cast(entity)
-        if circle:
-            result = {
-                "type": "sketchCircle",
-                "index": index,
-                "isConstruction": circle.isConstruction
-            }
-            try:
-                result["sketchName"] = circle.parentSketch.name
-                result["radius_cm"] = circle.radius
-
-                circles = circle.parentSketch.sketchCurves.sketchCircles
-                for i in range(circles.count):
-                    if circles.item(i) == circle:
-                        result["entityIndex"] = i
-                        break
-            except:
-                pass
-            return result
+    def _describe_sketch(self, sketch: adsk.fusion.Sketch, index: int, full: bool = True) -> dict:
+        """Describe a sketch"""
+        return {
+            "type": "sketch",
+            "index": index,
+            "name": sketch.name
+        }
 
-        # Sketch arc
-        arc = adsk.fusion.SketchArc.cast(entity)
-        if arc:
-            result = {
-                "type": "sketchArc",
-                "index": index,
-                "isConstruction": arc.isConstruction
-            }
-            try:
-                result["sketchName"] = arc.parentSketch.name
-                result["radius_cm"] = arc.radius
-
-                arcs = arc.parentSketch.sketchCurves.sketchArcs
-                for i in range(arcs.count):
-                    if arcs.item(i) == arc:
-                        result["entityIndex"] = i
-                        break
-            except:
-                pass
-            return result
+    def _describe_construction_plane(self, plane: adsk.fusion.ConstructionPlane, index: int, full: bool = True) -> dict:
+        """Describe a construction plane"""
+        return {
+            "type": "constructionPlane",
+            "index": index,
+            "name": getattr(plane, "name", "ConstructionPlane")
+        }
 
-        # Sketch point
-        point = adsk.fusion.SketchPoint.cast(entity)
-        if point:
-            result = {
-                "type": "sketchPoint",
-                "index": index
-            }
-            try:
-                result["sketchName"] = point.parentSketch.name
-                geo = point.geometry
-                result["position"] = {
-                    "x": geo.x,
-                    "y": geo.y,
-                    "z": geo.z
-                }
+    def _describe_sketch_entity(self, entity, index: int, full: bool = True) -> dict:
+        """Try to describe as sketch entity"""
+        for spec in _SKETCH_SPECS:
+            item = spec[1](entity)
+            if item:
+                return self._describe_sketch_item(item, index, full, spec)
+        return None
 
-                points = point.parentSketch.sketchPoints
-                for i in range(points.count):
-                    if points.item(i) == point:
-                        result["entityIndex"] = i
-                        break
-            except:
-                pass
-            return result
+    def _describe_sketch_item(self, item, index: int, full: bool, spec: tuple) -> dict:
+        """Describe a sketch curve or point as laid out by its _SKETCH_SPECS entry"""
+        _, _, entity_type, path, construction, fields = spec
+        result = {
+            "type": entity_type,
+            "index": index
+        }
+        if construction:
+            result["isConstruction"] = item.isConstruction
+        try:
+            sketch = item.parentSketch
+            result["sketchName"] = sketch.name
+            if full:
+                for key, attr, convert in fields:
+                    value = getattr(item, attr)
+                    result[key] = convert(value) if convert else value
+
+            # Find entity index in sketch
+            entity_index = self._index_of(sketch, path, item)
+            if entity_index is not None:
+                result["entityIndex"] = entity_index
+        except _API_ERRORS:
+            pass
+        return result
 
-        return None
+    def _index_of(self, owner, path: tuple, entity):
+        """Index of entity in the owner collection reached through path, or None
+
+        The entityToken -> index map for each body/sketch collection is built in one
+        pass and kept in the ResolverCache until the owner's revisionId changes,
+        instead of scanning the collection for every selected entity.
+        """
+        key = (owner.entityToken, path)
+        revision = owner.revisionId
+        resolver_cache = self.context.resolver_cache
+        cached = resolver_cache.get_entity_indices(key)
+        collection = None
+        if cached is None or cached[0] != revision:
+            collection = self._collection(owner, path)
+            cached = (revision, {collection.item(i).entityToken: i for i in range(collection.count)})
+            resolver_cache.put_entity_indices(key, cached)
+
+        indices = cached[1]
+        token = entity.entityToken
+        index = indices.get(token)
+        if index is None:
+            # Fusion may return a different token string for the same entity, so a
+            # miss is confirmed with one proxy-equality scan and the token remembered
+            if collection is None:
+                collection = self._collection(owner, path)
+            for i in range(collection.count):
+                if collection.item(i) == entity:
+                    index = indices[token] = i
+                    break
+        return index
+
+    @staticmethod
+    def _collection(owner, path: tuple):
+        """Collection reached from owner through the attribute names in path"""
+        collection = owner
+        for attr in path:
+            collection = getattr(collection, attr)
+        return collection
 
 
 class HighlightEntitiesHandler(BaseHandler):
     """Handler for highlight_entities action - temporarily highlights geometry"""
 
+    # Color names to RGB
+    _COLOR_MAP = {
+        "yellow": (255, 255, 0),
+        "red": (255, 0, 0),
+        "green": (0, 255, 0),
+        "blue": (0, 0, 255),
+        "orange": (255, 165, 0),
+        "cyan": (0, 255, 255),
+        "magenta": (255, 0, 255)
+    }
+    _ALLOWED_COLORS = frozenset(_COLOR_MAP)
+    # "yellow, red, ..." for the invalid-color message
+    _ALLOWED_COLORS_LIST = ", ".join(_COLOR_MAP)
+
     def validate(self, args: dict) -> dict:
         """Validate highlight arguments"""
         refs = args.get("refs", [])
@@ -394,8 +573,8 @@ class HighlightEntitiesHandler(BaseHandler):
             raise ValidationError("Cannot highlight more than 50 entities at once")
 
         color = args.get("color", "yellow")
-        if color not in ["yellow", "red", "green", "blue", "orange", "cyan", "magenta"]:
-            raise ValidationError(f"Invalid color '{color}'. Use: yellow, red, green, blue, orange, cyan, magenta")
+        if not isinstance(color, str) or color not in self._ALLOWED_COLORS:
+            raise ValidationError(f"Invalid color '{color}'. Use: {self._ALLOWED_COLORS_LIST}")
 
         duration_ms = args.get("duration_ms", 3000)
         if not isinstance(duration_ms, (int, float)) or duration_ms < 500 or duration_ms > 10000:
@@ -416,40 +595,42 @@ class HighlightEntitiesHandler(BaseHandler):
 
             app = self.context.app
             ui = app.userInterface
-            design = self.context.design
-
-            # Map color names to RGB
-            color_map = {
-                "yellow": (255, 255, 0),
-                "red": (255, 0, 0),
-                "green": (0, 255, 0),
-                "blue": (0, 0, 255),
-                "orange": (255, 165, 0),
-                "cyan": (0, 255, 255),
-                "magenta": (255, 0, 255)
-            }
-            rgb = color_map.get(color, (255, 255, 0))
-
-            highlighted_count = 0
-            errors = []
-
-            # Create custom graphics group for highlighting
-            root_comp = design.rootComponent
-            graphics = root_comp.customGraphicsGroups
+            # Fail the whole request up front when there is no active design
+            self.context.design
 
-            # Add to selection instead (more reliable visual feedback)
-            # Clear current selection first
-            ui.activeSelections.clear()
+            rgb = self._COLOR_MAP.get(color, (255, 255, 0))
 
+            # Resolve every ref first so the selection can be replaced in one call;
+            # each slot is [ref, entity or None, error message or None]
+            bodies = {}  # (component, body) -> (body, error), so refs sharing a body resolve it once
+            resolved = []
             for ref in refs:
+                # Malformed refs are reported without raising; exceptions are left
+                # for failures that need Fusion to detect (missing bodies, ranges)
+                ok, reason = self._validate_ref(ref)
+                if not ok:
+                    resolved.append([ref, None, f"Failed to highlight {ref}: {ValidationError(reason)}"])
+                    continue
                 try:
-                    entity = self._resolve_ref(ref)
-                    if entity:
-                        # Add to selection for visual feedback
-                        ui.activeSelections.add(entity)
-                        highlighted_count += 1
+                    resolved.append([ref, self._resolve_ref(ref, bodies), None])
                 except Exception as e:
-                    errors.append(f"Failed to highlight {ref}: {str(e)}")
+                    resolved.append([ref, None, f"Failed to highlight {ref}: {str(e)}"])
+
+            # Select instead of drawing custom graphics (more reliable visual feedback)
+            selections = ui.activeSelections
+            if not self._select_all(selections, [slot[1] for slot in resolved if slot[1]]):
+                # One add per entity, so a rejected entity only fails its own ref
+                selections.clear()
+                for slot in resolved:
+                    if slot[1]:
+                        try:
+                            selections.add(slot[1])
+                        except Exception as e:
+                            slot[1] = None
+                            slot[2] = f"Failed to highlight {slot[0]}: {str(e)}"
+
+            highlighted_count = sum(1 for slot in resolved if slot[1])
+            errors = [slot[2] for slot in resolved if slot[2] is not None]
 
             result = {
                 "highlighted": highlighted_count,
@@ -464,79 +645,125 @@ class HighlightEntitiesHandler(BaseHandler):
         except Exception as e:
             raise FusionAPIError(f"Failed to highlight entities: {str(e)}")
 
-    def _resolve_ref(self, ref: dict):
-        """Resolve an entity reference to a Fusion object"""
+    @staticmethod
+    def _select_all(selections, entities: list) -> bool:
+        """Replace the active selection with entities in one Selections.all assignment
+
+        One assignment refreshes the selection once instead of once per add().
+        Returns False, with the selection in an unknown state, if the API
+        refuses the batch; the caller then clears and adds entities one by one.
+        """
+        try:
+            collection = adsk.core.ObjectCollection.create()
+            for entity in entities:
+                collection.add(entity)
+            selections.all = collection
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _validate_ref(ref) -> tuple:
+        """(True, None) for a well-formed ref, else (False, reason); makes no Fusion calls"""
+        if not isinstance(ref, dict):
+            return False, "Each ref must be an object"
+
         ref_type = ref.get("type")
+        if ref_type == "face":
+            face_index = ref.get("faceIndex")
+            if face_index is None:
+                return False, "Face reference requires faceIndex"
+            if not is_index(face_index):
+                return False, "faceIndex must be a non-negative integer"
+        elif ref_type == "edge":
+            edge_index = ref.get("edgeIndex")
+            if edge_index is None:
+                return False, "Edge reference requires edgeIndex"
+            if not is_index(edge_index):
+                return False, "edgeIndex must be a non-negative integer"
+        elif ref_type == "component":
+            if not ref.get("name"):
+                return False, "Component reference requires name"
+        elif ref_type != "body":
+            return False, f"Unsupported ref type: {ref_type}"
+        return True, None
+
+    def _resolve_ref(self, ref: dict, bodies: dict):
+        """Resolve an entity reference that passed _validate_ref to a Fusion object"""
+        ref_type = ref["type"]
 
         if ref_type == "face":
-            return self._resolve_face_ref(ref)
+            return self._resolve_face_ref(ref, bodies)
         elif ref_type == "edge":
-            return self._resolve_edge_ref(ref)
+            return self._resolve_edge_ref(ref, bodies)
         elif ref_type == "body":
-            return self._resolve_body_ref(ref)
-        elif ref_type == "component":
-            return self._resolve_component_ref(ref)
+            return self._resolve_body_ref(ref, bodies)
         else:
-            raise ValidationError(f"Unsupported ref type: {ref_type}")
+            return self._resolve_component_ref(ref)
 
-    def _resolve_face_ref(self, ref: dict):
+    def _resolve_face_ref(self, ref: dict, bodies: dict):
         """Resolve face reference"""
-        component_name = ref.get("component") or ref.get("componentName")
-        body_name = ref.get("body") or ref.get("bodyName")
-        face_index = ref.get("faceIndex")
+        face_index = ref["faceIndex"]
 
-        if face_index is None:
-            raise ValidationError("Face reference requires faceIndex")
+        body = self._resolve_body_ref(ref, bodies)
 
-        body = self.resolver.resolve_body_ref({
-            "component": component_name,
-            "body": body_name
-        })
-
-        if face_index >= body.faces.count:
-            raise ValidationError(f"Face index {face_index} out of range (body has {body.faces.count} faces)")
+        faces = body.faces
+        face_count = faces.count
+        if face_index >= face_count:
+            raise ValidationError(f"Face index {face_index} out of range (body has {face_count} faces)")
 
-        return body.faces.item(face_index)
+        return faces.item(face_index)
 
-    def _resolve_edge_ref(self, ref: dict):
+    def _resolve_edge_ref(self, ref: dict, bodies: dict):
         """Resolve edge reference"""
-        component_name = ref.get("component") or ref.get("componentName")
-        body_name = ref.get("body") or ref.get("bodyName")
-        edge_index = ref.get("edgeIndex")
+        edge_index = ref["edgeIndex"]
 
-        if edge_index is None:
-            raise ValidationError("Edge reference requires edgeIndex")
-
-        body = self.resolver.resolve_body_ref({
-            "component": component_name,
-            "body": body_name
-        })
+        body = self._resolve_body_ref(ref, bodies)
 
-        if edge_index >= body.edges.count:
-            raise ValidationError(f"Edge index {edge_index} out of range (body has {body.edges.count} edges)")
+        edges = body.edges
+        edge_count = edges.count
+        if edge_index >= edge_count:
+            raise ValidationError(f"Edge index {edge_index} out of range (body has {edge_count} edges)")
 
-        return body.edges.item(edge_index)
+        return edges.item(edge_index)
 
-    def _resolve_body_ref(self, ref: dict):
-        """Resolve body reference"""
+    def _resolve_body_ref(self, ref: dict, bodies: dict):
+        """Resolve body reference, reusing this request's earlier result for the same body"""
         component_name = ref.get("component") or ref.get("componentName")
         body_name = ref.get("body") or ref.get("bodyName")
-
-        return self.resolver.resolve_body_ref({
+        body_ref = {
             "component": component_name,
             "body": body_name
-        })
+        }
+
+        key = (component_name, body_name)
+        try:
+            resolved = bodies.get(key)
+        except TypeError:
+            # Unhashable names can't be memoized; the resolver reports them
+            return self.resolver.resolve_body_ref(body_ref)
+
+        if resolved is None:
+            try:
+                resolved = (self.resolver.resolve_body_ref(body_ref), None)
+            except Exception as e:
+                resolved = (None, e)
+            bodies[key] = resolved
+
+        body, error = resolved
+        if error is not None:
+            raise error
+        return body
 
     def _resolve_component_ref(self, ref: dict):
         """Resolve component reference"""
-        name = ref.get("name")
-        if not name:
-            raise ValidationError("Component reference requires name")
+        name = ref["name"]
 
-        design = self.context.design
-        for comp in design.allComponents:
-            if comp.name == name:
-                return comp
+        comp = None
+        if isinstance(name, str):
+            comp = self.context.resolver_cache.get_component(self.context.design, name)
+        if comp is not None:
+            return comp
 
         raise ValidationError(f"Component '{name}' not found")
 
@@ -554,9 +781,10 @@ class ClearSelectionHandler(BaseHandler):
             app = self.context.app
             ui = app.userInterface
 
-            if ui and ui.activeSelections:
-                count = ui.activeSelections.count
-                ui.activeSelections.clear()
+            selections = ui.activeSelections if ui else None
+            if selections:
+                count = selections.count
+                selections.clear()
                 return {"cleared": count}
 
             return {"cleared": 0}
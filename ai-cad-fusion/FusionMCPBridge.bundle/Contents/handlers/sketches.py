@@ -5,11 +5,19 @@ import adsk.core
 import adsk.fusion
 from handlers.base import BaseHandler
 from core.errors import ValidationError, FusionAPIError
+from services.validators import is_index
 
 
 class CreateSketchHandler(BaseHandler):
     """Handler for create_sketch action"""
     
+    # Normalized plane name -> root component construction plane property
+    _PLANE_ATTR = {
+        "XY": "xYConstructionPlane",
+        "YZ": "yZConstructionPlane",
+        "XZ": "xZConstructionPlane",
+    }
+    
     def validate(self, args: dict) -> dict:
         """Validate sketch creation arguments"""
         self.validators.validate_required_fields(args, ["plane", "name"])
@@ -21,7 +29,9 @@ class CreateSketchHandler(BaseHandler):
         name = self.validators.validate_non_empty_string(args["name"], "name")
         
         # Check for name collision (determinism requirement)
-        self.validators.check_sketch_name_collision(name, self.context.root_component)
+        self.validators.check_sketch_name_collision(
+            name, self.context.root_component, self.context.resolver_cache
+        )
         
         return {
             "plane": plane,
@@ -33,16 +43,12 @@ class CreateSketchHandler(BaseHandler):
         root_comp = self.context.root_component
         
         # Get the construction plane based on the plane parameter
-        if args["plane"] == "XY":
-            construction_plane = root_comp.xYConstructionPlane
-        elif args["plane"] == "YZ":
-            construction_plane = root_comp.yZConstructionPlane
-        elif args["plane"] == "XZ":
-            construction_plane = root_comp.xZConstructionPlane
+        construction_plane = getattr(root_comp, self._PLANE_ATTR[args["plane"]])
         
         # Create the sketch
         sketch = root_comp.sketches.add(construction_plane)
         sketch.name = args["name"]
+        self.context.resolver_cache.add_sketch(root_comp, sketch)
         
         # Return the created sketch info
         result = {
@@ -64,22 +70,22 @@ class SketchDrawLineHandler(BaseHandler):
         start_point = args["start"]
         end_point = args["end"]
         
-        # Validate points
+        # Validate points, normalized to (x, y) floats for execute
+        coords = {}
         for point_name, point in [("start", start_point), ("end", end_point)]:
             if not isinstance(point, dict):
                 raise ValidationError(f"{point_name} point must be an object")
             if "x" not in point or "y" not in point:
                 raise ValidationError(f"{point_name} point must have 'x' and 'y' coordinates")
             try:
-                float(point["x"])
-                float(point["y"])
+                coords[point_name] = (float(point["x"]), float(point["y"]))
             except (ValueError, TypeError):
                 raise ValidationError(f"{point_name} coordinates must be numbers")
         
         return {
             "sketch": sketch_name,
-            "start": start_point,
-            "end": end_point
+            "start": coords["start"],
+            "end": coords["end"]
         }
     
     def execute(self, args: dict) -> dict:
@@ -88,13 +94,16 @@ class SketchDrawLineHandler(BaseHandler):
         target_sketch = self.resolver.resolve_sketch(args["sketch"])
         
         # Create points
-        start_pt = adsk.core.Point3D.create(float(args["start"]["x"]), float(args["start"]["y"]), 0)
-        end_pt = adsk.core.Point3D.create(float(args["end"]["x"]), float(args["end"]["y"]), 0)
+        start_pt = adsk.core.Point3D.create(*args["start"], 0)
+        end_pt = adsk.core.Point3D.create(*args["end"], 0)
         
         # Draw the line
         lines = target_sketch.sketchCurves.sketchLines
         line = lines.addByTwoPoints(start_pt, end_pt)
         
+        # Only the sketch's contents changed; keep the resolver's name indexes
+        self.context.resolver_cache.sketch_edited(self.context.root_component)
+        
         # Return the created line info - match monolithic format exactly
         result = {
             "sketch": args["sketch"],
@@ -124,14 +133,13 @@ class SketchDrawCircleHandler(BaseHandler):
         if "x" not in center_point or "y" not in center_point:
             raise ValidationError("Center point must have 'x' and 'y' coordinates")
         try:
-            float(center_point["x"])
-            float(center_point["y"])
+            center = (float(center_point["x"]), float(center_point["y"]))
         except (ValueError, TypeError):
             raise ValidationError("Center coordinates must be numbers")
         
         return {
             "sketch": sketch_name,
-            "center": center_point,
+            "center": center,
             "radius": radius
         }
     
@@ -141,12 +149,15 @@ class SketchDrawCircleHandler(BaseHandler):
         target_sketch = self.resolver.resolve_sketch(args["sketch"])
         
         # Create center point
-        center_pt = adsk.core.Point3D.create(float(args["center"]["x"]), float(args["center"]["y"]), 0)
+        center_pt = adsk.core.Point3D.create(*args["center"], 0)
         
         # Draw the circle
         circles = target_sketch.sketchCurves.sketchCircles
         circle = circles.addByCenterRadius(center_pt, args["radius"])
         
+        # Only the sketch's contents changed; keep the resolver's name indexes
+        self.context.resolver_cache.sketch_edited(self.context.root_component)
+        
         # Return the created circle info - match monolithic format exactly
         result = {
             "sketch": args["sketch"],
@@ -177,14 +188,13 @@ class SketchDrawRectangleHandler(BaseHandler):
         if "x" not in origin_point or "y" not in origin_point:
             raise ValidationError("Origin point must have 'x' and 'y' coordinates")
         try:
-            float(origin_point["x"])
-            float(origin_point["y"])
+            origin = (float(origin_point["x"]), float(origin_point["y"]))
         except (ValueError, TypeError):
             raise ValidationError("Origin coordinates must be numbers")
         
         return {
             "sketch": sketch_name,
-            "origin": origin_point,
+            "origin": origin,
             "width": width,
             "height": height
         }
@@ -195,17 +205,17 @@ class SketchDrawRectangleHandler(BaseHandler):
         target_sketch = self.resolver.resolve_sketch(args["sketch"])
         
         # Create corner points for the rectangle
-        origin_pt = adsk.core.Point3D.create(float(args["origin"]["x"]), float(args["origin"]["y"]), 0)
-        opposite_pt = adsk.core.Point3D.create(
-            float(args["origin"]["x"]) + args["width"], 
-            float(args["origin"]["y"]) + args["height"], 
-            0
-        )
+        x, y = args["origin"]
+        origin_pt = adsk.core.Point3D.create(x, y, 0)
+        opposite_pt = adsk.core.Point3D.create(x + args["width"], y + args["height"], 0)
         
         # Draw the rectangle using two corner points
         lines = target_sketch.sketchCurves.sketchLines
         rectangle = lines.addTwoPointRectangle(origin_pt, opposite_pt)
         
+        # Only the sketch's contents changed; keep the resolver's name indexes
+        self.context.resolver_cache.sketch_edited(self.context.root_component)
+        
         # The rectangle returns a collection of 4 lines, we'll return the index of the first line
         # Match monolithic format exactly
         result = {
@@ -233,7 +243,9 @@ class CreateSketchFromFaceHandler(BaseHandler):
             raise ValidationError("faceRef must be an object")
         
         # Check for name collision (determinism requirement)
-        self.validators.check_sketch_name_collision(name, self.context.root_component)
+        self.validators.check_sketch_name_collision(
+            name, self.context.root_component, self.context.resolver_cache
+        )
         
         return {
             "faceRef": face_ref,
@@ -247,13 +259,14 @@ class CreateSketchFromFaceHandler(BaseHandler):
         # Resolve face reference
         face = self.resolver.resolve_face_ref(args["faceRef"])
         
-        # Ensure face is planar
-        if not hasattr(face, 'geometry') or not hasattr(face.geometry, 'normal'):
+        # Ensure face is planar; the geometry is fetched once and checked by type
+        if not isinstance(getattr(face, 'geometry', None), adsk.core.Plane):
             raise ValidationError("Target face must be planar")
         
         # Create sketch on face
         sketch = root_comp.sketches.add(face)
         sketch.name = args["name"]
+        self.context.resolver_cache.add_sketch(root_comp, sketch)
         
         return {"sketchName": sketch.name}
 
@@ -287,16 +300,35 @@ class ProjectEdgesHandler(BaseHandler):
         # Find sketch
         target_sketch = self.resolver.resolve_sketch(args["sketch"])
         
-        projected_count = 0
-        oc = adsk.core.ObjectCollection.create()
+        # The collection is only read by project(), so a pooled one is reused
+        oc = self.context.borrow_object_collection()
+        try:
+            self._collect_edges(args, oc)
+            projected_count = oc.count
+            if projected_count > 0:
+                # project() may return a collection; conservatively report the number of projected inputs
+                target_sketch.project(oc)
+        finally:
+            self.context.return_object_collection(oc)
+        
+        # Only the sketch's contents changed; keep the resolver's name indexes
+        self.context.resolver_cache.sketch_edited(self.context.root_component)
         
+        return {"projectedCount": projected_count}
+    
+    def _collect_edges(self, args: dict, oc):
+        """Add the edges named by faceRef or edgeRefs to oc"""
         if args["faceRef"] is not None:
             face = self.resolver.resolve_face_ref(args["faceRef"])
             # Project all edges of the face
-            for i in range(face.edges.count):
-                oc.add(face.edges.item(i))
+            edges = face.edges
+            for i in range(edges.count):
+                oc.add(edges.item(i))
         elif args["edgeRefs"] is not None:
             edge_refs = args["edgeRefs"]
+            root_name = self.context.root_component.name
+            # body name -> (edges, edge count), so refs into one body resolve it once
+            body_edges = {}
             for er in edge_refs:
                 if not isinstance(er, dict):
                     raise ValidationError("edgeRef must be an object")
@@ -304,26 +336,20 @@ class ProjectEdgesHandler(BaseHandler):
                 body = er.get("body") 
                 idx = er.get("edgeIndex")
                 
-                if comp != self.context.root_component.name:
+                if comp != root_name:
                     raise ValidationError("Only edges in the root component are supported in v0")
                 
-                b = self.resolver.resolve_body_ref({"component": comp, "body": body})
-                try:
-                    eidx = int(idx)
-                    if eidx < 0 or eidx >= b.edges.count:
-                        raise ValidationError(f"edgeIndex {eidx} out of range (0-{b.edges.count-1})")
-                except (TypeError, ValueError):
+                cached = body_edges.get(body) if isinstance(body, str) else None
+                if cached is None:
+                    b = self.resolver.resolve_body_ref({"component": comp, "body": body})
+                    edges = b.edges
+                    cached = body_edges[body] = (edges, edges.count)
+                edges, edge_count = cached
+                if not is_index(idx):
                     raise ValidationError("edgeIndex must be a non-negative integer")
-                oc.add(b.edges.item(eidx))
-        
-        if oc.count > 0:
-            res = target_sketch.project(oc)
-            # res may be a collection; conservatively report the number of projected inputs
-            projected_count = oc.count
-        else:
-            projected_count = 0
-        
-        return {"projectedCount": projected_count}
+                if idx >= edge_count:
+                    raise ValidationError(f"edgeIndex {idx} out of range (0-{edge_count-1})")
+                oc.add(edges.item(idx))
 
 
 class SetIsConstructionHandler(BaseHandler):
@@ -347,11 +373,7 @@ class SetIsConstructionHandler(BaseHandler):
         if ent_type != "line":
             raise ValidationError("Only line entity type is supported in v0")
         
-        try:
-            idx = int(ent_index)
-            if idx < 0:
-                raise ValueError()
-        except Exception:
+        if not is_index(ent_index):
             raise ValidationError("entityRef.index must be a non-negative integer")
         
         return {
@@ -365,7 +387,7 @@ class SetIsConstructionHandler(BaseHandler):
         # Find sketch
         target_sketch = self.resolver.resolve_sketch(args["sketch"])
         
-        idx = int(args["entityRef"]["index"])
+        idx = args["entityRef"]["index"]
         lines = target_sketch.sketchCurves.sketchLines
         if idx >= lines.count:
             raise ValidationError(f"Line index {idx} out of range (0-{lines.count-1})")
@@ -373,4 +395,7 @@ class SetIsConstructionHandler(BaseHandler):
         line = lines.item(idx)
         line.isConstruction = args["value"]
         
+        # Only the sketch's contents changed; keep the resolver's name indexes
+        self.context.resolver_cache.sketch_edited(self.context.root_component)
+        
         return {"updated": True}
@@ -1,6 +1,7 @@
 """
 Viewport-related handlers - visual context for agents
 """
+import functools
 import os
 import tempfile
 import base64
@@ -9,6 +10,26 @@ import adsk.fusion
 from handlers.base import BaseHandler
 from core.errors import FusionAPIError, ValidationError
 
+# Largest multiple of 3 under 64 KiB, so each chunk encodes without padding
+_B64_CHUNK = 65535
+
+
+def _read_base64(path: str):
+    """(base64 text, size in bytes) of the file at path, encoded chunk by chunk
+
+    Only the encoded output is held in full, not the raw bytes alongside it.
+    """
+    encoded = bytearray()
+    size = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_B64_CHUNK)
+            if not chunk:
+                break
+            size += len(chunk)
+            encoded += base64.b64encode(chunk)
+    return encoded.decode('ascii'), size
+
 
 class CaptureViewportHandler(BaseHandler):
     """Handler for capture_viewport action - screenshot current view"""
@@ -53,7 +74,9 @@ class CaptureViewportHandler(BaseHandler):
             if not viewport:
                 raise FusionAPIError("No active viewport to capture")
 
-            # Generate temp path if not provided
+            # Generate temp path if not provided; when only base64 is wanted the file
+            # is scratch, deleted after reading and not reported back
+            scratch = not output_path and return_base64
             if not output_path:
                 temp_dir = tempfile.gettempdir()
                 output_path = os.path.join(temp_dir, f"fusion_viewport_{os.getpid()}.png")
@@ -67,19 +90,23 @@ class CaptureViewportHandler(BaseHandler):
             result = {
                 "format": "png",
                 "width": width,
-                "height": height,
-                "path": output_path
+                "height": height
             }
+            if not scratch:
+                result["path"] = output_path
 
             # Read and encode as base64 if requested
             if return_base64:
                 try:
-                    with open(output_path, "rb") as f:
-                        image_data = f.read()
-                    result["data"] = base64.b64encode(image_data).decode('utf-8')
-                    result["size_bytes"] = len(image_data)
+                    result["data"], result["size_bytes"] = _read_base64(output_path)
                 except Exception as e:
                     result["base64_error"] = str(e)
+                finally:
+                    if scratch:
+                        try:
+                            os.unlink(output_path)
+                        except OSError:
+                            pass
 
             return result
 
@@ -89,6 +116,15 @@ class CaptureViewportHandler(BaseHandler):
             raise FusionAPIError(f"Failed to capture viewport: {str(e)}")
 
 
+@functools.lru_cache(maxsize=None)
+def _up_vector(up_dir: tuple):
+    """Vector3D for a standard view's up direction, created on first use and shared
+
+    Assigning camera.upVector copies the vector, so every set_camera call can reuse these.
+    """
+    return adsk.core.Vector3D.create(*up_dir)
+
+
 class SetCameraHandler(BaseHandler):
     """Handler for set_camera action - set view orientation"""
 
@@ -142,40 +178,39 @@ class SetCameraHandler(BaseHandler):
 
                 # Try to get bounding box for distance calculation
                 distance = 50.0  # Default distance in cm
-                target = adsk.core.Point3D.create(0, 0, 0)
+                cx = cy = cz = 0.0
 
                 try:
                     bbox = root_comp.boundingBox
                     if bbox and bbox.isValid:
-                        # Calculate center
-                        cx = (bbox.minPoint.x + bbox.maxPoint.x) / 2
-                        cy = (bbox.minPoint.y + bbox.maxPoint.y) / 2
-                        cz = (bbox.minPoint.z + bbox.maxPoint.z) / 2
-                        target = adsk.core.Point3D.create(cx, cy, cz)
+                        # Read each corner once
+                        mn, mx = bbox.minPoint, bbox.maxPoint
+                        mnx, mny, mnz = mn.x, mn.y, mn.z
+                        mxx, mxy, mxz = mx.x, mx.y, mx.z
 
                         # Calculate distance based on bbox size
-                        dx = bbox.maxPoint.x - bbox.minPoint.x
-                        dy = bbox.maxPoint.y - bbox.minPoint.y
-                        dz = bbox.maxPoint.z - bbox.minPoint.z
-                        max_dim = max(dx, dy, dz)
+                        max_dim = max(mxx - mnx, mxy - mny, mxz - mnz)
                         distance = max_dim * 2.5  # Reasonable framing distance
+
+                        # Calculate center
+                        cx = (mnx + mxx) * 0.5
+                        cy = (mny + mxy) * 0.5
+                        cz = (mnz + mxz) * 0.5
                 except:
                     pass
+                target = adsk.core.Point3D.create(cx, cy, cz)
 
                 # Set eye position
                 eye_dir = view_config["eye"]
                 eye = adsk.core.Point3D.create(
-                    target.x + eye_dir[0] * distance,
-                    target.y + eye_dir[1] * distance,
-                    target.z + eye_dir[2] * distance
+                    cx + eye_dir[0] * distance,
+                    cy + eye_dir[1] * distance,
+                    cz + eye_dir[2] * distance
                 )
 
-                up_dir = view_config["up"]
-                up = adsk.core.Vector3D.create(up_dir[0], up_dir[1], up_dir[2])
-
                 camera.eye = eye
                 camera.target = target
-                camera.upVector = up
+                camera.upVector = _up_vector(view_config["up"])
 
             if fit_all:
                 camera.isFitView = True
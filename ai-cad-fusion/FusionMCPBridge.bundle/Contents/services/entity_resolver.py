@@ -1,23 +1,21 @@
 """
-Entity resolution without object caching (safer for Fusion's environment)
+Entity resolution through revision-keyed name indexes (see services.resolver_cache)
 """
 import adsk.core
 import adsk.fusion
 from core.errors import ValidationError, FusionAPIError
 from services.fusion_context import FusionContext
+from services.validators import is_index
 
 
 class EntityResolver:
-    """Entity resolution without object caching (safer for Fusion's environment)"""
+    """Entity resolution through revision-keyed name indexes (see services.resolver_cache)"""
     
     def __init__(self, fusion_context: FusionContext):
         self._context = fusion_context
         
     def resolve_body_ref(self, ref: dict):
-        """Resolve bodyRef to Fusion body - always fresh lookup"""
-        # Note: We don't cache BRepBody objects as they can become stale
-        # after geometry changes. The lookup is fast enough.
-        
+        """Resolve bodyRef to Fusion body"""
         # Validation
         if not isinstance(ref, dict):
             raise ValidationError("bodyRef must be an object")
@@ -33,19 +31,19 @@ class EntityResolver:
         if comp_name != root_comp.name:
             raise ValidationError("Only bodies in the root component are supported in v0")
         
-        # Linear search is fine - body lists are typically small
-        for body in root_comp.bRepBodies:
-            if body.name == body_name:
-                return body
+        # Index is rebuilt whenever the root component's revision changes
+        body = self._context.resolver_cache.get_body(root_comp, body_name)
+        if body is not None:
+            return body
                 
         raise ValidationError(f"Body '{body_name}' not found in component '{comp_name}'")
     
     def resolve_sketch(self, name: str):
-        """Resolve sketch by name - always fresh lookup"""
+        """Resolve sketch by name"""
         root_comp = self._context.root_component
-        for sketch in root_comp.sketches:
-            if sketch.name == name:
-                return sketch
+        sketch = self._context.resolver_cache.get_sketch(root_comp, name)
+        if sketch is not None:
+            return sketch
         raise ValidationError(f"Sketch '{name}' not found")
     
     def resolve_face_ref(self, ref: dict):
@@ -64,13 +62,13 @@ class EntityResolver:
         body = self.resolve_body_ref({"component": comp_name, "body": body_name})
         
         # Then get the face by index
-        try:
-            idx = int(face_index)
-            if idx < 0 or idx >= body.faces.count:
-                raise ValidationError(f"faceIndex {idx} out of range (0-{body.faces.count-1})")
-            return body.faces.item(idx)
-        except (TypeError, ValueError):
+        if not is_index(face_index):
             raise ValidationError("faceIndex must be a non-negative integer")
+        faces = body.faces
+        count = faces.count
+        if face_index >= count:
+            raise ValidationError(f"faceIndex {face_index} out of range (0-{count-1})")
+        return faces.item(face_index)
 
     def resolve_edge_ref(self, ref: dict):
         """Resolve edgeRef to Fusion edge - v0 scope"""
@@ -88,10 +86,9 @@ class EntityResolver:
         body = self.resolve_body_ref({"component": comp_name, "body": body_name})
 
         # Then get the edge by index
-        try:
-            idx = int(edge_index)
-            if idx < 0 or idx >= body.edges.count:
-                raise ValidationError(f"edgeIndex {idx} out of range (0-{body.edges.count-1})")
-            return body.edges.item(idx)
-        except (TypeError, ValueError):
+        if not is_index(edge_index):
             raise ValidationError("edgeIndex must be a non-negative integer")
+        count = body.edges.count
+        if edge_index >= count:
+            raise ValidationError(f"edgeIndex {edge_index} out of range (0-{count-1})")
+        return self._context.resolver_cache.get_edge(body, body_name, edge_index)
@@ -1,24 +1,80 @@
 """
-Centralized Fusion 360 API context management - no caching of Fusion objects
+Centralized Fusion 360 API context management - the active document/design/viewport
+are cached until a Fusion event invalidates them; resolver indexes live in ResolverCache
 """
 import adsk.core
 import adsk.fusion
 from core.errors import FusionAPIError
+from services.resolver_cache import ResolverCache
+
+
+class _DocumentInvalidator(adsk.core.DocumentEventHandler):
+    """Clears the context's active-object cache on document events"""
+
+    def __init__(self, context):
+        super().__init__()
+        self._context = context
+
+    def notify(self, args):
+        self._context.invalidate()
+
+
+class _WorkspaceInvalidator(adsk.core.WorkspaceEventHandler):
+    """Clears the context's active-object cache when the workspace (product) changes"""
+
+    def __init__(self, context):
+        super().__init__()
+        self._context = context
+
+    def notify(self, args):
+        self._context.invalidate()
+
+
+class _CommandInvalidator(adsk.core.ApplicationCommandEventHandler):
+    """Clears the context's active-object cache when a UI command finishes"""
+
+    def __init__(self, context):
+        super().__init__()
+        self._context = context
+
+    def notify(self, args):
+        self._context.invalidate()
 
 
 class FusionContext:
-    """Centralized Fusion 360 API context management - no caching of Fusion objects"""
-    
+    """Centralized Fusion 360 API context management
+
+    design and root_component re-read app.activeProduct on every access and
+    raise FusionAPIError without a design; handlers that create or modify
+    geometry use them. active_doc, active_design (None when the product is not
+    a design), ui and viewport are cached until a Fusion document, workspace or
+    command event calls invalidate(); the read-only context handlers, which
+    agents poll, use them. resolver_cache holds the name indexes, dropped on the
+    same events and whenever the root component's revision changes.
+    """
+
     def __init__(self):
         self._app = None
-        
+        # Active document/design/ui/viewport between Fusion events - see invalidate()
+        self._active = {}
+        # (event, handler) pairs; Fusion only keeps handlers alive while we hold them
+        self._subscriptions = []
+        # Name indexes for EntityResolver and the parameter handlers - see ResolverCache
+        self._resolver_cache = ResolverCache()
+        # invalidate() only bumps _generation (Fusion events fire on the main thread);
+        # the request path drops the caches when it sees a new one - see _sync()
+        self._generation = 0
+        self._synced_generation = 0
+        # Cleared ObjectCollections for reuse - see borrow_object_collection()
+        self._collections = []
+
     @property
     def app(self):
         """Lazy initialization of Fusion app"""
         if self._app is None:
             self._app = adsk.core.Application.get()
         return self._app
-    
+
     @property
     def design(self):
         """Get active design - always fresh, never cached"""
@@ -26,8 +82,119 @@ class FusionContext:
         if not design or not hasattr(design, 'rootComponent'):
             raise FusionAPIError("No active design document")
         return design
-    
+
     @property
     def root_component(self):
         """Get root component - always fresh, never cached"""
         return self.design.rootComponent
+
+    @property
+    def active_doc(self):
+        """Active document, cached until the next document/workspace/command event"""
+        return self._cached("doc", lambda: self.app.activeDocument)
+
+    @property
+    def active_design(self):
+        """Active product cast to Design (None if not a design), cached like active_doc"""
+        return self._cached("design", lambda: adsk.fusion.Design.cast(self.app.activeProduct))
+
+    @property
+    def ui(self):
+        """Application user interface"""
+        return self._cached("ui", lambda: self.app.userInterface)
+
+    @property
+    def viewport(self):
+        """Active viewport, cached like active_doc"""
+        return self._cached("viewport", lambda: self.app.activeViewport)
+
+    def borrow_object_collection(self):
+        """An empty ObjectCollection, reused from earlier requests when one is free
+
+        Hand it back with return_object_collection() once the API call that reads it returns.
+        """
+        if self._collections:
+            return self._collections.pop()
+        return adsk.core.ObjectCollection.create()
+
+    def return_object_collection(self, collection):
+        """Clear a borrowed collection, so it holds no entities, and keep it for reuse"""
+        try:
+            collection.clear()
+        except RuntimeError:
+            # Not reusable; drop it rather than mask the caller's own error
+            return
+        self._collections.append(collection)
+
+    @property
+    def resolver_cache(self):
+        """Name indexes for EntityResolver and the parameter handlers, current as of the last invalidate()"""
+        self._sync()
+        return self._resolver_cache
+
+    def _sync(self):
+        """Drop the caches if invalidate() ran since the last request-path access
+
+        Only request threads (which hold the bridge's registry lock) clear the
+        caches, so a Fusion event can never empty an index mid-lookup.
+        """
+        generation = self._generation
+        if generation != self._synced_generation:
+            self._synced_generation = generation
+            self._active.clear()
+            self._resolver_cache.clear()
+
+    def _cached(self, key: str, fetch):
+        """Return the cached active object for key, fetching it on a miss
+
+        Nothing is cached until subscribe_events() succeeds, since without the
+        events there is nothing to invalidate the cache. None is never cached.
+        """
+        self._sync()
+        value = self._active.get(key)
+        if value is None:
+            value = fetch()
+            if value is not None and self._subscriptions:
+                self._active[key] = value
+        return value
+
+    def invalidate(self):
+        """Mark cached active objects and resolver indexes stale; handlers that switch documents call this directly
+
+        Safe from Fusion's event thread: it only bumps a counter, and the next
+        cache access on the request path does the clearing.
+        """
+        self._generation += 1
+
+    def subscribe_events(self):
+        """Invalidate the active-object cache on Fusion document, workspace and command events"""
+        if self._subscriptions:
+            return
+        app = self.app
+        ui = app.userInterface
+        try:
+            for event, handler_cls in (
+                (app.documentActivated, _DocumentInvalidator),
+                (app.documentDeactivated, _DocumentInvalidator),
+                (app.documentClosed, _DocumentInvalidator),
+                (app.documentOpened, _DocumentInvalidator),
+                (ui.workspaceActivated, _WorkspaceInvalidator),
+                (ui.commandTerminated, _CommandInvalidator),
+            ):
+                handler = handler_cls(self)
+                event.add(handler)
+                self._subscriptions.append((event, handler))
+        except Exception:
+            # All or nothing: a partial set would leave the cache under-invalidated
+            self.unsubscribe_events()
+            raise
+
+    def unsubscribe_events(self):
+        """Remove event handlers added by subscribe_events()"""
+        for event, handler in self._subscriptions:
+            try:
+                event.remove(handler)
+            except Exception:
+                pass
+        self._subscriptions = []
+        self.invalidate()
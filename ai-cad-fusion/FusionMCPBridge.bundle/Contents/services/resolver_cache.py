@@ -0,0 +1,254 @@
+"""
+Name indexes for entity resolution, valid for a single root component revision,
+plus the design's user parameter and component indexes
+"""
+
+
+class ResolverCache:
+    """Body/sketch/edge lookups for the root component, dropped whenever its revisionId changes
+
+    Entries are Fusion objects, so every hit is checked with isValid and a miss
+    rebuilds the index once before reporting "not found". Handlers that create
+    bodies add them with add_bodies() rather than forcing a full rebuild.
+    """
+
+    def __init__(self):
+        self._revision = None
+        self._bodies = None
+        # body entityToken -> (body revisionId, volume or None) for get_selection
+        self._volumes = {}
+        self._sketches = None
+        self._edges = {}
+        # (component, body, edgeIndex) -> (unit axis Vector3D, origin Point3D) of linear edges
+        self._edge_axes = {}
+        # (owner entityToken, collection path) -> (owner revisionId, {entityToken: index})
+        self._entity_indices = {}
+        # User parameters don't bump the root revision; keyed on count instead
+        self._params = None
+        self._params_count = None
+        # Components of the whole design, keyed on (root revisionId, component count)
+        self._components = None
+        self._components_key = None
+
+    def clear(self):
+        """Forget every index"""
+        self._revision = None
+        self._bodies = None
+        self._volumes = {}
+        self._sketches = None
+        self._edges = {}
+        self._edge_axes = {}
+        self._entity_indices = {}
+        self._params = None
+        self._params_count = None
+        self._components = None
+        self._components_key = None
+
+    def _sync(self, root_comp):
+        """Drop the geometry indexes if the root component changed since they were built"""
+        revision = root_comp.revisionId
+        if revision != self._revision:
+            self._revision = revision
+            self._bodies = None
+            self._volumes = {}
+            self._sketches = None
+            self._edges = {}
+            self._edge_axes = {}
+            self._entity_indices = {}
+
+    @staticmethod
+    def _index(collection) -> dict:
+        """name -> object, first occurrence wins like the linear scans it replaces"""
+        index = {}
+        for item in collection:
+            index.setdefault(item.name, item)
+        return index
+
+    def get_body(self, root_comp, name: str):
+        """BRepBody named name in root_comp, or None"""
+        self._sync(root_comp)
+        if self._bodies is None:
+            self._bodies = self._index(root_comp.bRepBodies)
+        body = self._bodies.get(name)
+        if body is None or not body.isValid:
+            self._bodies = self._index(root_comp.bRepBodies)
+            body = self._bodies.get(name)
+        return body
+
+    def body_index(self, root_comp, rebuild: bool = False) -> dict:
+        """name -> BRepBody for root_comp, for handlers resolving many bodies in one request
+
+        Entries are not isValid-checked; rebuild=True rescans the bodies once,
+        which callers use on their first miss instead of once per missing name.
+        """
+        self._sync(root_comp)
+        if self._bodies is None or rebuild:
+            self._bodies = self._index(root_comp.bRepBodies)
+        return self._bodies
+
+    def get_volume(self, token: str):
+        """Cached (body revisionId, volume or None) for a body entityToken, or None
+
+        Callers compare the body's revisionId themselves; entries are dropped
+        with the body index.
+        """
+        return self._volumes.get(token)
+
+    def put_volume(self, token: str, volume: tuple):
+        """Remember the (body revisionId, volume or None) read for a body entityToken"""
+        self._volumes[token] = volume
+
+    def get_sketch(self, root_comp, name: str):
+        """Sketch named name in root_comp, or None"""
+        self._sync(root_comp)
+        if self._sketches is None:
+            self._sketches = self._index(root_comp.sketches)
+        sketch = self._sketches.get(name)
+        if sketch is None or not sketch.isValid:
+            self._sketches = self._index(root_comp.sketches)
+            sketch = self._sketches.get(name)
+        return sketch
+
+    def has_sketch(self, root_comp, name: str) -> bool:
+        """Whether root_comp has a sketch named name, for name-collision checks
+
+        Unlike get_sketch, a miss on the current revision's index is trusted
+        without a rebuild, so the common no-collision case stays O(1).
+        """
+        self._sync(root_comp)
+        if self._sketches is None:
+            self._sketches = self._index(root_comp.sketches)
+        sketch = self._sketches.get(name)
+        if sketch is not None and not sketch.isValid:
+            self._sketches = self._index(root_comp.sketches)
+            sketch = self._sketches.get(name)
+        return sketch is not None
+
+    def get_edge(self, body, body_name: str, index: int):
+        """Edge index of body; the caller has already range-checked index"""
+        key = (body_name, index)
+        edge = self._edges.get(key)
+        if edge is None or not edge.isValid:
+            edge = self._edges[key] = body.edges.item(index)
+        return edge
+
+    def get_edge_axis(self, root_comp, key: tuple):
+        """Cached (axis, origin) for an edgeRef key, or None; dropped with the revision"""
+        self._sync(root_comp)
+        return self._edge_axes.get(key)
+
+    def put_edge_axis(self, key: tuple, axis: tuple):
+        """Remember the normalised (axis, origin) computed for an edgeRef key"""
+        self._edge_axes[key] = axis
+
+    def get_entity_indices(self, key: tuple):
+        """Cached (owner revisionId, {entityToken: index}) for an (owner token, path) key, or None
+
+        Callers compare the owner's revisionId themselves; every entry is dropped
+        with the root revision and on clear().
+        """
+        return self._entity_indices.get(key)
+
+    def put_entity_indices(self, key: tuple, indices: tuple):
+        """Remember the (owner revisionId, {entityToken: index}) map built for a key"""
+        self._entity_indices[key] = indices
+
+    def add_bodies(self, root_comp, bodies, existing_unchanged: bool = False):
+        """Index bodies a handler just created and adopt the component's new revision
+
+        bodies may be a live Fusion collection; it is only read when a body index exists.
+        Pass existing_unchanged=True when the feature cannot have altered the bodies
+        that were already there (copy/paste), so their edge lookups survive.
+        """
+        if self._bodies is None or not bodies:
+            return
+        self._revision = root_comp.revisionId
+        if not existing_unchanged:
+            # The feature may have changed existing topology, so edge indexes are stale
+            self._edges = {}
+            self._edge_axes = {}
+        for body in bodies:
+            self._bodies.setdefault(body.name, body)
+
+    def add_sketch(self, root_comp, sketch):
+        """Index a sketch a handler just created and named, and adopt the component's new revision
+
+        Adding a sketch touches no bodies, so the body and edge indexes survive.
+        """
+        if self._bodies is None and self._sketches is None:
+            return
+        self._revision = root_comp.revisionId
+        if self._sketches is not None:
+            self._sketches.setdefault(sketch.name, sketch)
+
+    def get_parameter(self, design, name: str):
+        """UserParameter named name in design, or None
+
+        A miss is trusted without a rebuild so name-collision checks stay O(1);
+        parameters added or removed elsewhere change the count, and UI edits
+        (renames) clear the cache through FusionContext's command event.
+        """
+        params = design.userParameters
+        count = params.count
+        if self._params is None or count != self._params_count:
+            self._params = self._index(params)
+            self._params_count = count
+        param = self._params.get(name)
+        if param is not None and not param.isValid:
+            self._params = self._index(params)
+            param = self._params.get(name)
+        return param
+
+    def get_component(self, design, name: str):
+        """Component named name anywhere in design, or None
+
+        The index is rebuilt when the root component's revision or the component
+        count changes; a hit is checked for validity and its current name, and a
+        miss rebuilds once, so renames made elsewhere are still found.
+        """
+        components = design.allComponents
+        key = (design.rootComponent.revisionId, components.count)
+        if self._components is None or key != self._components_key:
+            self._components = self._index(components)
+            self._components_key = key
+            rebuilt = True
+        else:
+            rebuilt = False
+        comp = self._components.get(name)
+        if not rebuilt and (comp is None or not comp.isValid or comp.name != name):
+            self._components = self._index(components)
+            comp = self._components.get(name)
+        return comp
+
+    def add_parameter(self, param):
+        """Index a UserParameter a handler just created"""
+        if self._params is None:
+            return
+        self._params.setdefault(param.name, param)
+        self._params_count += 1
+
+    def sketch_edited(self, root_comp):
+        """Adopt the revision after a handler only edited the contents of a sketch
+
+        Drawing, projecting and constraining add, remove and rename no sketches or
+        bodies, so the name indexes stay valid. A sketch that drives features can
+        still change body topology when they recompute, so edge lookups are dropped.
+        """
+        if self._bodies is None and self._sketches is None:
+            return
+        self._revision = root_comp.revisionId
+        self._edges = {}
+        self._edge_axes = {}
+
+    def moved_bodies(self, root_comp, body_names):
+        """Adopt the revision after a move feature that only transformed body_names
+
+        A move adds, removes and renames nothing, so the name indexes stay valid;
+        only edge lookups and edge axes on the moved bodies are dropped.
+        """
+        if self._bodies is None:
+            return
+        self._revision = root_comp.revisionId
+        moved = set(body_names)
+        self._edges = {k: v for k, v in self._edges.items() if k[0] not in moved}
+        self._edge_axes = {k: v for k, v in self._edge_axes.items() if k[1] not in moved}
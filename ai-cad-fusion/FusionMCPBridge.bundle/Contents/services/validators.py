@@ -15,6 +15,8 @@ class ValidationService:
     ALLOWED_DIRECTIONS = ["positive", "negative", "symmetric"]
     ALLOWED_ORIENTATIONS = ["horizontal", "vertical", "aligned"]
     ALLOWED_CONSTRAINT_TYPES = ["horizontal", "vertical", "parallel", "perpendicular", "tangent", "coincident"]
+    # Membership sets; the lists above keep their order for error messages
+    _UNIT_SET = frozenset(ALLOWED_UNITS)
     
     def validate_required_fields(self, args: dict, required: List[str]) -> None:
         """Validate required fields are present"""
@@ -30,7 +32,7 @@ class ValidationService:
         """Validate unit is allowed"""
         if not isinstance(unit, str):
             raise ValidationError(f"Invalid unit type: {type(unit)}")
-        if unit not in self.ALLOWED_UNITS:
+        if unit not in self._UNIT_SET:
             raise ValidationError(f"Invalid unit '{unit}'. Allowed units: {', '.join(repr(u) for u in self.ALLOWED_UNITS)}")
     
     def validate_plane(self, plane: str) -> str:
@@ -73,18 +75,15 @@ class ValidationService:
             raise ValidationError(f"{field_name} must be a non-empty string")
         return value.strip()
     
-    def check_parameter_name_collision(self, name: str, design: Any) -> None:
-        """Check if parameter name already exists (determinism requirement)"""
-        if design.userParameters:
-            for param in design.userParameters:
-                if param.name == name:
-                    raise ValidationError(f"Parameter '{name}' already exists")
+    def check_parameter_name_collision(self, name: str, design: Any, cache: Any) -> None:
+        """Check if parameter name already exists (determinism requirement) via the ResolverCache index"""
+        if cache.get_parameter(design, name) is not None:
+            raise ValidationError(f"Parameter '{name}' already exists")
     
-    def check_sketch_name_collision(self, name: str, root_comp: Any) -> None:
-        """Check if sketch name already exists (determinism requirement)"""
-        for sketch in root_comp.sketches:
-            if sketch.name == name:
-                raise ValidationError(f"Sketch '{name}' already exists")
+    def check_sketch_name_collision(self, name: str, root_comp: Any, cache: Any) -> None:
+        """Check if sketch name already exists (determinism requirement) via the ResolverCache index"""
+        if cache.has_sketch(root_comp, name):
+            raise ValidationError(f"Sketch '{name}' already exists")
     
     def validate_operation(self, operation: str) -> None:
         """Validate operation type"""
@@ -105,3 +104,135 @@ class ValidationService:
         """Validate constraint type"""
         if constraint_type not in self.ALLOWED_CONSTRAINT_TYPES:
             raise ValidationError(f"Constraint type must be one of: {', '.join(self.ALLOWED_CONSTRAINT_TYPES)}")
+
+
+def is_index(value: Any) -> bool:
+    """Whether value is a non-negative int, as entity indexes must be (bool is rejected)"""
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+# Straight-line code per schema field kind, used by schema_validated. Each snippet
+# reads the raw value from `v` and binds the cleaned value to `{var}`; messages
+# match the ValidationService method the kind replaces.
+_FIELD_CODE = {
+    "raw": (
+        "    {var} = v\n"
+    ),
+    "str": (
+        "    {var} = str(v)\n"
+    ),
+    "optional_str": (
+        "    {var} = None if v is None else str(v)\n"
+    ),
+    "optional_string": (
+        "    if v is not None and not isinstance(v, str):\n"
+        "        raise ValidationError({field!r} ' must be a string when provided')\n"
+        "    {var} = v\n"
+    ),
+    "non_empty_string": (
+        "    if not isinstance(v, str) or not v.strip():\n"
+        "        raise ValidationError({field!r} ' must be a non-empty string')\n"
+        "    {var} = v.strip()\n"
+    ),
+    "non_negative_int": (
+        "    try:\n"
+        "        {var} = int(v)\n"
+        "    except (TypeError, ValueError):\n"
+        "        raise ValidationError({field!r} ' must be a non-negative integer')\n"
+        "    if {var} < 0:\n"
+        "        raise ValidationError({field!r} ' must be a non-negative integer')\n"
+    ),
+    "positive_number": (
+        "    try:\n"
+        "        {var} = float(v)\n"
+        "    except (TypeError, ValueError):\n"
+        "        raise ValidationError({field!r} ' must be a positive number')\n"
+        "    if {var} <= 0:\n"
+        "        raise ValidationError({field!r} ' must be a positive number')\n"
+    ),
+    "bool": (
+        "    if not isinstance(v, bool):\n"
+        "        raise ValidationError({field!r} ' must be a boolean')\n"
+        "    {var} = v\n"
+    ),
+    "unit": (
+        "    if not isinstance(v, str):\n"
+        "        raise ValidationError(f'Invalid unit type: {{type(v)}}')\n"
+        "    if v not in _UNITS:\n"
+        "        raise ValidationError(f\"Invalid unit '{{v}}'. \" + _UNITS_MSG)\n"
+        "    {var} = v\n"
+    ),
+    "optional_unit": (
+        "    if v is not None:\n"
+        "        if not isinstance(v, str):\n"
+        "            raise ValidationError({field!r} ' must be a string when provided')\n"
+        "        if v not in _UNITS:\n"
+        "            raise ValidationError(f\"Invalid unit '{{v}}'. \" + _UNITS_MSG)\n"
+        "    {var} = v\n"
+    ),
+    "operation": (
+        "    if v not in _OPERATIONS:\n"
+        "        raise ValidationError(_OPERATIONS_MSG)\n"
+        "    {var} = v\n"
+    ),
+    "direction": (
+        "    if v not in _DIRECTIONS:\n"
+        "        raise ValidationError(_DIRECTIONS_MSG)\n"
+        "    {var} = v\n"
+    ),
+}
+
+# Names the generated validators close over
+_SCHEMA_GLOBALS = {
+    "ValidationError": ValidationError,
+    "_UNITS": ValidationService._UNIT_SET,
+    "_UNITS_MSG": "Allowed units: " + ", ".join(repr(u) for u in ValidationService.ALLOWED_UNITS),
+    # Tuples, not sets: these values are not type-checked first and may be unhashable
+    "_OPERATIONS": tuple(ValidationService.ALLOWED_OPERATIONS),
+    "_OPERATIONS_MSG": "Operation must be one of: " + ", ".join(ValidationService.ALLOWED_OPERATIONS),
+    "_DIRECTIONS": tuple(ValidationService.ALLOWED_DIRECTIONS),
+    "_DIRECTIONS_MSG": "Direction must be one of: " + ", ".join(ValidationService.ALLOWED_DIRECTIONS),
+}
+
+# Marks a schema field as required (no default)
+_REQUIRED = object()
+
+
+def schema_validated(cls):
+    """Class decorator generating cls._validate_fast(args) from cls.SCHEMA
+
+    SCHEMA maps field name -> kind (required) or (kind, default) (optional), in
+    the order the checks should run; kinds are the keys of _FIELD_CODE. The
+    generated method checks required fields, validates every field with its
+    kind's checks inlined, and returns the cleaned dict - the same errors as
+    the equivalent ValidationService calls, without dispatching through it.
+    """
+    fields = []
+    for field, spec in cls.SCHEMA.items():
+        kind, default = (spec, _REQUIRED) if isinstance(spec, str) else spec
+        if kind not in _FIELD_CODE:
+            raise ValueError(f"{cls.__name__}.SCHEMA: unknown kind '{kind}' for '{field}'")
+        fields.append((field, kind, default))
+
+    required = [f for f, _, d in fields if d is _REQUIRED]
+    namespace = dict(_SCHEMA_GLOBALS, _required=required)
+    lines = ["def _validate_fast(self, args):\n"]
+    if required:
+        lines.append("    if " + " or ".join(f"{f!r} not in args" for f in required) + ":\n")
+        lines.append("        missing = [f for f in _required if f not in args]\n")
+        lines.append("        if len(missing) == 1:\n")
+        lines.append("            raise ValidationError(f'Missing required field: {missing[0]}')\n")
+        lines.append("        raise ValidationError(f\"Missing required fields: {', '.join(missing)}\")\n")
+    for i, (field, kind, default) in enumerate(fields):
+        if default is _REQUIRED:
+            lines.append(f"    v = args[{field!r}]\n")
+        else:
+            namespace[f"_default{i}"] = default
+            lines.append(f"    v = args.get({field!r}, _default{i})\n")
+        lines.append(_FIELD_CODE[kind].format(field=field, var=f"f{i}"))
+    lines.append("    return {" + ", ".join(f"{field!r}: f{i}" for i, (field, _, _) in enumerate(fields)) + "}\n")
+
+    source = "".join(lines)
+    exec(compile(source, f"<schema_validated {cls.__name__}>", "exec"), namespace)
+    cls._validate_fast = namespace["_validate_fast"]
+    return cls
@@ -233,6 +233,7 @@ class ExtrudeProfileArgs(BaseModel):
     distance: float
     operation: str = "new_body"
     direction: str = "positive"
+    returnCreatedBodies: bool = False  # Include bodies/createdBodies in the result
 
 
 class UpdateParameterArgs(BaseModel):
@@ -353,6 +354,14 @@ class RotateBodyArgs(BaseModel):
     copy: Optional[bool] = False
 
 
+class RotateBodiesArgs(BaseModel):
+    """Arguments for rotate_bodies tool"""
+    bodies: List[Dict[str, Any]]  # [bodyRef]
+    pivot: Dict[str, Any]         # Same shape as rotate_body pivot
+    angle: float                  # degrees
+    copy: Optional[bool] = False
+
+
 # Context-awareness argument models
 class GetEditContextArgs(BaseModel):
     """Arguments for get_edit_context tool - none required"""
@@ -362,6 +371,7 @@ class GetEditContextArgs(BaseModel):
 class GetSketchStateArgs(BaseModel):
     """Arguments for get_sketch_state tool"""
     sketch: Optional[str] = None  # Optional - defaults to active sketch if in sketch edit mode
+    detailed: Optional[bool] = False  # Per-curve construction count and per-type constraint breakdown
 
 
 class GetCameraStateArgs(BaseModel):
@@ -369,9 +379,15 @@ class GetCameraStateArgs(BaseModel):
     pass
 
 
+class GetAllContextArgs(BaseModel):
+    """Arguments for get_all_context tool"""
+    detailed: Optional[bool] = False  # Passed through to the sketch state section
+
+
 class GetSelectionArgs(BaseModel):
-    """Arguments for get_selection tool - none required"""
-    pass
+    """Arguments for get_selection tool"""
+    mode: Optional[str] = "full"  # "count" returns per-type counts, "ids" type + entityToken only
+    detail: Optional[str] = "full"  # "minimal" skips geometry and measurement reads
 
 
 class HighlightEntitiesArgs(BaseModel):
@@ -405,6 +421,13 @@ class FitAllArgs(BaseModel):
     pass
 
 
+class BatchActionsArgs(BaseModel):
+    """Arguments for batch_actions tool"""
+    actions: List[Dict[str, Any]]  # [{action: str, args?: {...}}]
+    timelineGroup: Optional[bool] = True  # Group created timeline entries into one
+    stopOnError: Optional[bool] = True
+
+
 # Initialize bridge client
 bridge = BridgeClient(BRIDGE_BASE_URL, BRIDGE_TIMEOUT)
 
@@ -705,6 +728,11 @@ async def list_tools(params=None) -> List[Tool]:
                         "enum": ["positive", "negative", "symmetric"],
                         "default": "positive",
                         "description": "Extrusion direction"
+                    },
+                    "returnCreatedBodies": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Include the created bodies (bodies and createdBodies) in the result"
                     }
                 },
                 "required": ["sketch", "profile_index", "distance"],
@@ -722,7 +750,7 @@ async def list_tools(params=None) -> List[Tool]:
                             },
                             "bodies": {
                                 "type": "array",
-                                "description": "Bodies created by the extrusion (if any)",
+                                "description": "Bodies created by the extrusion (only when returnCreatedBodies is true)",
                                 "items": {
                                     "type": "object",
                                     "properties": {
@@ -730,6 +758,11 @@ async def list_tools(params=None) -> List[Tool]:
                                         "type": {"type": "string"}
                                     }
                                 }
+                            },
+                            "createdBodies": {
+                                "type": "array",
+                                "description": "bodyRefs of created bodies (only when returnCreatedBodies is true)",
+                                "items": {"type": "object"}
                             }
                         }
                     }
@@ -754,7 +787,8 @@ async def list_tools(params=None) -> List[Tool]:
                         "description": "Axis reference; v0 supports origin axes X/Y/Z"
                     },
                     "angle": {"type": "number", "minimum": 0.001, "description": "Revolve angle in degrees"},
-                    "operation": {"type": "string", "enum": ["new_body", "join", "cut", "intersect"], "default": "new_body"}
+                    "operation": {"type": "string", "enum": ["new_body", "join", "cut", "intersect"], "default": "new_body"},
+                    "returnCreatedBodies": {"type": "boolean", "default": False, "description": "Include createdBodies in the result"}
                 },
                 "required": ["sketch", "profile_index", "axisRef", "angle"],
                 "_meta": {
@@ -763,7 +797,7 @@ async def list_tools(params=None) -> List[Tool]:
                         "type": "object",
                         "properties": {
                             "feature": {"type": "object", "properties": {"type": {"type": "string"}, "name": {"type": "string"}}},
-                            "createdBodies": {"type": "array", "items": {"type": "object"}}
+                            "createdBodies": {"type": "array", "items": {"type": "object"}, "description": "Only when returnCreatedBodies is true"}
                         }
                     }
                 }
@@ -862,6 +896,68 @@ async def list_tools(params=None) -> List[Tool]:
             }
         ),
 
+        Tool(
+            name="rotate_bodies",
+            description="Rotate several bodies by the same angle about one pivot as a single move feature",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "bodies": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "component": {"type": "string"},
+                                "body": {"type": "string"}
+                            },
+                            "required": ["component", "body"]
+                        },
+                        "minItems": 1,
+                        "description": "References to the bodies to rotate"
+                    },
+                    "pivot": {
+                        "type": "object",
+                        "properties": {
+                            "type": {"type": "string", "enum": ["origin_axis", "edge_axis"]},
+                            "axis": {"type": "string", "enum": ["X", "Y", "Z"], "description": "For origin_axis: rotation axis"},
+                            "edgeRef": {
+                                "type": "object",
+                                "properties": {
+                                    "component": {"type": "string"},
+                                    "body": {"type": "string"},
+                                    "edgeIndex": {"type": "integer"}
+                                },
+                                "description": "For edge_axis: edge to use as rotation axis"
+                            }
+                        },
+                        "required": ["type"],
+                        "description": "Pivot point/axis for rotation"
+                    },
+                    "angle": {
+                        "type": "number",
+                        "description": "Rotation angle in degrees (positive = counterclockwise)"
+                    },
+                    "copy": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "If true, create rotated copies; if false, transform in place"
+                    }
+                },
+                "required": ["bodies", "pivot", "angle"],
+                "_meta": {
+                    "schemaVersion": SCHEMA_VERSION,
+                    "returnSchema": {
+                        "type": "object",
+                        "properties": {
+                            "success": {"type": "boolean"},
+                            "transformedBodies": {"type": "array", "description": "bodyRefs of transformed bodies (when copy=false)"},
+                            "createdBodies": {"type": "array", "description": "bodyRefs of new bodies (when copy=true)"}
+                        }
+                    }
+                }
+            }
+        ),
+
         # Phase 0 - Foundation tools
         Tool(
             name="list_open_documents",
@@ -1105,7 +1201,8 @@ async def list_tools(params=None) -> List[Tool]:
                     "returnSchema": {
                         "type": "object",
                         "properties": {
-                            "measurements": {"type": "array"}
+                            "measurements": {"type": "array"},
+                            "totalVolume": {"type": "number", "description": "Sum of the measured volumes over distinct bodies (cm^3), when any were measured"}
                         }
                     }
                 }
@@ -1432,6 +1529,11 @@ async def list_tools(params=None) -> List[Tool]:
                     "sketch": {
                         "type": "string",
                         "description": "Sketch name (optional - defaults to active sketch if in sketch edit mode)"
+                    },
+                    "detailed": {
+                        "type": "boolean",
+                        "description": "Include construction-geometry count and constraint counts by type (walks every curve and constraint; default false returns totals only)",
+                        "default": False
                     }
                 },
                 "required": [],
@@ -1474,12 +1576,51 @@ async def list_tools(params=None) -> List[Tool]:
                 }
             }
         ),
+        Tool(
+            name="get_all_context",
+            description="Get edit context, active sketch state and camera state in one call. Prefer this over calling get_edit_context, get_sketch_state and get_camera_state back to back.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "detailed": {
+                        "type": "boolean",
+                        "description": "Include construction-geometry count and constraint counts by type in sketchState",
+                        "default": False
+                    }
+                },
+                "required": [],
+                "_meta": {
+                    "schemaVersion": SCHEMA_VERSION,
+                    "returnSchema": {
+                        "type": "object",
+                        "properties": {
+                            "editContext": {"type": "object"},
+                            "sketchState": {"type": ["object", "null"]},
+                            "cameraState": {"type": ["object", "null"]}
+                        }
+                    }
+                }
+            }
+        ),
         Tool(
             name="get_selection",
             description="Get information about currently selected entities in Fusion. Returns details about selected faces, edges, bodies, sketch entities, etc. Essential for understanding what the user wants to operate on.",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "mode": {
+                        "type": "string",
+                        "enum": ["full", "count", "ids"],
+                        "default": "full",
+                        "description": "'count' returns only {count, types} with the number of selected entities per type; 'ids' returns each entity's type, index and entityToken without describing it; 'full' describes each entity (see detail)"
+                    },
+                    "detail": {
+                        "type": "string",
+                        "enum": ["minimal", "full"],
+                        "default": "full",
+                        "description": "'minimal' returns only the names and indices needed to reference each entity, skipping surface/curve types, areas, lengths, positions and volumes; use 'full' when locations or measurements are needed"
+                    }
+                },
                 "required": [],
                 "_meta": {
                     "schemaVersion": SCHEMA_VERSION,
@@ -1488,7 +1629,8 @@ async def list_tools(params=None) -> List[Tool]:
                         "properties": {
                             "count": {"type": "integer"},
                             "entities": {"type": "array"},
-                            "truncated": {"type": "boolean"}
+                            "truncated": {"type": "boolean"},
+                            "types": {"type": "object"}
                         }
                     }
                 }
@@ -1579,7 +1721,7 @@ async def list_tools(params=None) -> List[Tool]:
                             "format": {"type": "string"},
                             "width": {"type": "integer"},
                             "height": {"type": "integer"},
-                            "path": {"type": "string"},
+                            "path": {"type": "string", "description": "Only when the caller supplied path, or set return_base64 to false (then a temp file)"},
                             "data": {"type": "string"},
                             "size_bytes": {"type": "integer"}
                         }
@@ -1633,6 +1775,49 @@ async def list_tools(params=None) -> List[Tool]:
                     }
                 }
             }
+        ),
+        Tool(
+            name="batch_actions",
+            description="Run several bridge actions in order in a single request (e.g. many extrudes or rotations). In parametric designs the timeline entries they create are collapsed into one timeline group. Each step reports its own result or error.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "actions": {
+                        "type": "array",
+                        "description": "Steps to run in order",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "action": {"type": "string", "description": "Action name, e.g. extrude_profile"},
+                                "args": {"type": "object", "description": "Arguments for that action"}
+                            },
+                            "required": ["action"]
+                        }
+                    },
+                    "timelineGroup": {
+                        "type": "boolean",
+                        "description": "Group the timeline entries created by the batch (default true)",
+                        "default": True
+                    },
+                    "stopOnError": {
+                        "type": "boolean",
+                        "description": "Stop at the first failing step (default true)",
+                        "default": True
+                    }
+                },
+                "required": ["actions"],
+                "_meta": {
+                    "schemaVersion": SCHEMA_VERSION,
+                    "returnSchema": {
+                        "type": "object",
+                        "properties": {
+                            "completed": {"type": "integer"},
+                            "results": {"type": "array"},
+                            "timelineGroup": {"type": "string"}
+                        }
+                    }
+                }
+            }
         )
     ]
 
@@ -1893,6 +2078,16 @@ async def _handle_rotate_body(arguments: dict, request_id: str) -> List[TextCont
     logger.info(f"[{request_id}] rotate_body completed successfully")
     return create_json_response(result)
 
+async def _handle_rotate_bodies(arguments: dict, request_id: str) -> List[TextContent]:
+    try:
+        validated_args = RotateBodiesArgs(**arguments)
+    except ValidationError as e:
+        logger.error(f"[{request_id}] Validation error: {str(e)}")
+        return create_error_response(f"Validation error: {str(e)}", "VALIDATION_ERROR")
+    result = await bridge.execute_action("rotate_bodies", validated_args.dict(exclude_none=True), request_id=request_id)
+    logger.info(f"[{request_id}] rotate_bodies completed successfully")
+    return create_json_response(result)
+
 # Sheet Metal Workflow handlers
 async def _handle_create_sketch_from_face(arguments: dict, request_id: str) -> List[TextContent]:
     try:
@@ -1972,6 +2167,17 @@ async def _handle_get_camera_state(arguments: dict, request_id: str) -> List[Tex
     return create_json_response(result)
 
 
+async def _handle_get_all_context(arguments: dict, request_id: str) -> List[TextContent]:
+    try:
+        validated_args = GetAllContextArgs(**arguments)
+    except ValidationError as e:
+        logger.error(f"[{request_id}] Validation error: {str(e)}")
+        return create_error_response(f"Validation error: {str(e)}", "VALIDATION_ERROR")
+    result = await bridge.execute_action("get_all_context", validated_args.dict(exclude_none=True), request_id=request_id)
+    logger.info(f"[{request_id}] get_all_context completed successfully")
+    return create_json_response(result)
+
+
 async def _handle_get_selection(arguments: dict, request_id: str) -> List[TextContent]:
     try:
         validated_args = GetSelectionArgs(**arguments)
@@ -2038,6 +2244,17 @@ async def _handle_fit_all(arguments: dict, request_id: str) -> List[TextContent]
     return create_json_response(result)
 
 
+async def _handle_batch_actions(arguments: dict, request_id: str) -> List[TextContent]:
+    try:
+        validated_args = BatchActionsArgs(**arguments)
+    except ValidationError as e:
+        logger.error(f"[{request_id}] Validation error: {str(e)}")
+        return create_error_response(f"Validation error: {str(e)}", "VALIDATION_ERROR")
+    result = await bridge.execute_action("batch_actions", validated_args.dict(exclude_none=True), request_id=request_id)
+    logger.info(f"[{request_id}] batch_actions completed successfully")
+    return create_json_response(result)
+
+
 _TOOL_HANDLERS: dict[str, Handler] = {
     "get_design_info": _handle_get_design_info,
     "create_parameter": _handle_create_parameter,
@@ -2065,6 +2282,7 @@ _TOOL_HANDLERS: dict[str, Handler] = {
     "revolve_profile": _handle_revolve_profile,
     "combine_bodies": _handle_combine_bodies,
     "rotate_body": _handle_rotate_body,
+    "rotate_bodies": _handle_rotate_bodies,
     # Sheet Metal Workflow tools
     "create_sketch_from_face": _handle_create_sketch_from_face,
     "project_edges": _handle_project_edges,
@@ -2074,12 +2292,14 @@ _TOOL_HANDLERS: dict[str, Handler] = {
     "get_edit_context": _handle_get_edit_context,
     "get_sketch_state": _handle_get_sketch_state,
     "get_camera_state": _handle_get_camera_state,
+    "get_all_context": _handle_get_all_context,
     "get_selection": _handle_get_selection,
     "highlight_entities": _handle_highlight_entities,
     "clear_selection": _handle_clear_selection,
     "capture_viewport": _handle_capture_viewport,
     "set_camera": _handle_set_camera,
     "fit_all": _handle_fit_all,
+    "batch_actions": _handle_batch_actions,
 }
 
 @server.call_tool()